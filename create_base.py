@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Define your project structure here
 # Keys are folder names; values are either:
@@ -42,18 +43,114 @@ structure = {
 }
 
 
+# Folders and files are created from a small thread pool. mkdir/open spend
+# their time waiting on the filesystem (and release the GIL while they do),
+# so on slow or network drives several can be in flight at once.
+MAX_WORKERS = 8
+
+
+def plan_structure(base_path, structure):
+    """Walk the structure dict and return (leaf_dirs, files) as full paths.
+
+    The tree is walked once with an explicit stack (no recursion). Only the
+    deepest folders are returned: os.makedirs already creates every missing
+    parent, so one call per leaf folder covers the whole chain.
+    """
+    leaf_dirs = []
+    files = []
+    stack = [(base_path, structure)]
+    while stack:
+        parent, node = stack.pop()
+        has_subfolders = False
+        for name, content in node.items():
+            # Plain concatenation: names in the structure dict are known to be
+            # clean, so os.path.join's separator handling isn't needed
+            path = parent + os.sep + name
+            if isinstance(content, dict):
+                # It's a folder
+                has_subfolders = True
+                stack.append((path, content))
+            elif content is None:
+                # It's a file
+                files.append(path)
+        if not has_subfolders:
+            leaf_dirs.append(parent)
+    return leaf_dirs, files
+
+
+def scan_existing(root):
+    """Return the set of all paths below root using one scandir per folder."""
+    existing = set()
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                existing.add(entry.path)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return existing
+
+
+def _make_dir(path):
+    os.makedirs(path, exist_ok=True)
+
+
+def _make_file(path):
+    # Exclusive create: makes the file if missing and fails atomically
+    # if it already exists, so no separate exists() check is needed.
+    # os.open also skips the buffered/text wrappers of open().
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        os.close(fd)
+    except FileExistsError:
+        pass
+
+
+def _run_parallel(func, paths):
+    """Call func on every path, using the thread pool when there's more than one."""
+    if len(paths) < 2:
+        for path in paths:
+            func(path)
+        return
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # list() drains the iterator so any OSError is raised here
+        list(executor.map(func, paths))
+
+
+def create_dirs(leaf_dirs):
+    """Create each leaf folder (and its parents) with one makedirs call."""
+    # Leaves are independent of each other; two makedirs racing on a shared
+    # parent is fine because exist_ok=True tolerates the loser
+    _run_parallel(_make_dir, leaf_dirs)
+
+
+def create_files(files, existing):
+    """Create each file that isn't already in the existing set."""
+    # Runs after create_dirs, so every parent folder is already there
+    _run_parallel(_make_file, [path for path in files if path not in existing])
+
+
 def create_structure(base_path, structure):
-    """Recursively create folders and files based on structure dict."""
+    """Create folders and files based on structure dict.
+
+    The existing tree is scanned once and only the missing folders and
+    files are created, so a project that is already complete costs one
+    scandir per folder instead of a mkdir/open per entry.
+    """
     for name, content in structure.items():
-        path = os.path.join(base_path, name)
-        if isinstance(content, dict):
-            # It's a folder
-            os.makedirs(path, exist_ok=True)
-            create_structure(path, content)
-        elif content is None:
-            # It's a file
-            if not os.path.exists(path):
-                open(path, "w").close()
+        root = base_path + os.sep + name
+        if content is None:
+            create_files([root], existing=set())
+            continue
+        if not isinstance(content, dict):
+            continue
+
+        leaf_dirs, files = plan_structure(root, content)
+        existing = scan_existing(root) if os.path.isdir(root) else set()
+
+        create_dirs([d for d in leaf_dirs if d not in existing])
+        create_files(files, existing)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,25 @@
+"""
+Response classes shared by the routers.
+
+FastJSONResponse is FastAPI's ORJSONResponse when the orjson package is
+installed, and the standard JSONResponse otherwise. orjson is a compiled
+JSON encoder - several times faster than the json module - but it is
+optional: the app works the same without it, just a little slower.
+
+Usage in route:
+    from app.api.responses import FastJSONResponse
+
+    @router.get("/thing")
+    async def thing():
+        # Returning a Response directly also skips FastAPI's response_model
+        # validation and jsonable_encoder pass
+        return FastJSONResponse({"status": "success"})
+"""
+
+try:
+    import orjson  # noqa: F401 - only checking that it is installed
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as FastJSONResponse
+
+__all__ = ["FastJSONResponse"]
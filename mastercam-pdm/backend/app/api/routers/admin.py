@@ -1,34 +1,85 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Form, Request
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi import APIRouter, HTTPException, status, Form, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from typing import Annotated, Literal
 
 # Import our schemas, dependencies, and services
 from app.models import schemas
+from app.api.responses import FastJSONResponse
 from app.api.dependencies import (
-    get_git_repo,
-    get_lock_manager,
-    get_current_admin_user,
-    get_user_auth,
-    get_config_manager
+    AdminUser,
+    GitRepoDep,
+    LockManagerDep,
+    UserAuthDep,
+    ConfigManagerDep
 )
-from app.services.git_service import GitRepository
-from app.services.lock_service import MetadataManager
-from app.core.security import UserAuth
-from app.core.config import ConfigManager
+import asyncio
+import functools
+import hashlib
+import io
+import json
 import logging
+import os
 import shutil
 import stat
+import secrets
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
 import psutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import subprocess
 
 logger = logging.getLogger(__name__)
 
+# IMPORTANT: Every route in this file must take an `admin_user: AdminUser`
+# parameter - that is what protects it. There is deliberately no router-level
+# dependencies=[Depends(get_current_admin_user)]: every route already needs
+# the admin's username, so a router-level copy would only add a second node
+# to each route's dependency graph.
+#
+# The routes are async, so anything slow (Git commits and pushes, walking the
+# repo tree, bcrypt hashing, deleting or copying the repository) is handed to
+# a worker thread with run_in_threadpool. Calling it directly would stall the
+# event loop and every other user's request along with it.
+#
+# Successful responses are built with _success(), which returns the JSON
+# response object directly. The routes keep response_model=StandardResponse
+# for the API docs, but FastAPI skips validating and re-encoding a Response
+# that is returned as-is.
 router = APIRouter(
     prefix="/admin",  # All routes here will start with /admin
     tags=["Administration"],
-    # IMPORTANT: This protects ALL routes in this file
-    dependencies=[Depends(get_current_admin_user)]
+    default_response_class=FastJSONResponse,
+)
+
+
+def _success(message: str, **extra) -> FastJSONResponse:
+    """Build the standard {"status": "success", "message": ...} response."""
+    return FastJSONResponse({"status": "success", "message": message, **extra})
+
+# One-at-a-time guards for the expensive repository operations. Two resets
+# racing each other's rmtree/clone would break the repo, and parallel
+# backups or exports just fight over the disk. A second request while one
+# is running gets 409 Conflict straight away instead of queueing.
+# Reset and backup finish inside their handler, so an asyncio.Lock is
+# enough. An export keeps running after the handler returns (the response
+# body is produced in a worker thread), so it uses a threading.Lock that the
+# streaming code releases when it is done.
+_reset_lock = asyncio.Lock()
+_backup_lock = asyncio.Lock()
+_export_lock = threading.Lock()
+
+_EXC_EXPORT_BUSY = HTTPException(
+    status_code=status.HTTP_409_CONFLICT,
+    detail="An export is already in progress"
 )
 
 
@@ -36,29 +87,29 @@ router = APIRouter(
 async def admin_override_lock(
     filename: str,
     request: schemas.AdminOverrideRequest,
-    # We can still get the user info if needed
-    admin_user: dict = Depends(get_current_admin_user),
-    git_repo: GitRepository = Depends(get_git_repo),
-    lock_manager: MetadataManager = Depends(get_lock_manager)
+    admin_user: AdminUser,
+    git_repo: GitRepoDep,
+    lock_manager: LockManagerDep
 ):
     """(Admin) Forcibly removes a lock from a file."""
     if request.admin_user != admin_user.get('sub'):
         raise HTTPException(status_code=403, detail="Admin username mismatch.")
 
-    file_path = git_repo.find_file_path(filename)
+    file_path = await run_in_threadpool(git_repo.find_file_path, filename)
     if not file_path:
         raise HTTPException(status_code=404, detail="File not found.")
 
     lock_info = lock_manager.get_lock_info(file_path)
     if not lock_info:
-        return {"status": "success", "message": "File was already unlocked."}
+        return _success("File was already unlocked.")
 
     lock_file_path = lock_manager._get_lock_file_path(file_path)
     relative_lock_path = str(lock_file_path.relative_to(git_repo.repo_path))
 
     lock_manager.release_lock(file_path)
 
-    success = git_repo.commit_and_push(
+    success = await run_in_threadpool(
+        git_repo.commit_and_push,
         file_paths=[relative_lock_path],
         message=f"ADMIN OVERRIDE: Unlock {filename} by {request.admin_user}",
         author_name=request.admin_user
@@ -70,18 +121,86 @@ async def admin_override_lock(
         raise HTTPException(
             status_code=500, detail="Failed to commit lock override.")
 
-    return {"status": "success", "message": f"Lock on '{filename}' has been overridden."}
+    return _success(f"Lock on '{filename}' has been overridden.")
+
+
+@router.post("/files/override-batch", response_model=schemas.StandardResponse)
+async def admin_override_lock_batch(
+    request: schemas.AdminOverrideBatchRequest,
+    admin_user: AdminUser,
+    git_repo: GitRepoDep,
+    lock_manager: LockManagerDep
+):
+    """
+    (Admin) Forcibly removes the locks from several files at once.
+
+    Same as the single-file override, but all the released lock files go into
+    ONE commit and ONE push instead of a commit + push per file.
+
+    Files that don't exist or are already unlocked are skipped and listed in
+    the response message.
+    """
+    if request.admin_user != admin_user.get('sub'):
+        raise HTTPException(status_code=403, detail="Admin username mismatch.")
+
+    # Duplicates would try to release (and later restore) the same lock twice
+    filenames = list(dict.fromkeys(request.filenames))
+    if not filenames:
+        raise HTTPException(status_code=400, detail="No files given.")
+
+    def _find_all():
+        return {name: git_repo.find_file_path(name) for name in filenames}
+
+    found = await run_in_threadpool(_find_all)
+    missing = [name for name, path in found.items() if not path]
+
+    # (file_path, lock_info, relative_lock_path) for every locked file
+    locked = []
+    for name, file_path in found.items():
+        if not file_path:
+            continue
+        lock_info = lock_manager.get_lock_info(file_path)
+        if lock_info:
+            lock_file_path = lock_manager._get_lock_file_path(file_path)
+            locked.append((file_path, lock_info,
+                           str(lock_file_path.relative_to(git_repo.repo_path))))
+
+    if locked:
+        for file_path, _, _ in locked:
+            lock_manager.release_lock(file_path)
+
+        success = await run_in_threadpool(
+            git_repo.commit_and_push,
+            file_paths=[rel_path for _, _, rel_path in locked],
+            message=f"ADMIN OVERRIDE BATCH: Unlock {len(locked)} files by {request.admin_user}",
+            author_name=request.admin_user
+        )
+
+        if not success:
+            # Best effort to restore every lock if push fails
+            for file_path, lock_info, _ in locked:
+                lock_manager.create_lock(file_path, lock_info['user'], force=True)
+            raise HTTPException(
+                status_code=500, detail="Failed to commit lock overrides.")
+
+    message = f"Overrode {len(locked)} lock(s)."
+    already_unlocked = len(found) - len(missing) - len(locked)
+    if already_unlocked:
+        message += f" {already_unlocked} file(s) were already unlocked."
+    if missing:
+        message += f" Not found: {', '.join(missing)}."
+    return _success(message)
 
 
 @router.delete("/files/{filename}/delete", response_model=schemas.StandardResponse)
 async def admin_delete_file(
     filename: str,
-    admin_user: dict = Depends(get_current_admin_user),
-    git_repo: GitRepository = Depends(get_git_repo),
-    lock_manager: MetadataManager = Depends(get_lock_manager)
+    admin_user: AdminUser,
+    git_repo: GitRepoDep,
+    lock_manager: LockManagerDep
 ):
     """(Admin) Permanently deletes a file and its metadata."""
-    file_path = git_repo.find_file_path(filename)
+    file_path = await run_in_threadpool(git_repo.find_file_path, filename)
     if not file_path:
         raise HTTPException(status_code=404, detail="File not found.")
 
@@ -91,7 +210,8 @@ async def admin_delete_file(
 
     files_to_remove = git_repo.delete_file_and_metadata(file_path)
 
-    success = git_repo.commit_and_push(
+    success = await run_in_threadpool(
+        git_repo.commit_and_push,
         file_paths=files_to_remove,
         message=f"ADMIN DELETE: Remove {filename} by {admin_user.get('sub')}",
         author_name=admin_user.get('sub')
@@ -101,42 +221,85 @@ async def admin_delete_file(
         raise HTTPException(
             status_code=500, detail="Failed to commit file deletion.")
 
-    return {"status": "success", "message": f"File '{filename}' permanently deleted."}
+    return _success(f"File '{filename}' permanently deleted.")
 
 
 # ============================================================================
 # USER MANAGEMENT ENDPOINTS
 # ============================================================================
 
+# Last serialized /admin/users response: (users file signature, body, etag).
+# The user list only changes when users.json does, so the JSON body and its
+# ETag are rebuilt only when the file's signature (inode, size, mtime)
+# changes - os.replace in UserAuth._save_users always gives a new one.
+_users_response_cache = None
+
+
+def _users_file_signature(auth_service) -> tuple:
+    try:
+        st = os.stat(auth_service.auth_file)
+    except FileNotFoundError:
+        return (id(auth_service), None)
+    return (id(auth_service), st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _invalidate_users_cache():
+    """Drop the cached user list (called after any user change)."""
+    global _users_response_cache
+    _users_response_cache = None
+
+
 @router.get("/users")
 async def list_users(
-    admin_user: dict = Depends(get_current_admin_user),
-    auth_service: UserAuth = Depends(get_user_auth)
+    request: Request,
+    admin_user: AdminUser,
+    auth_service: UserAuthDep
 ):
     """
     (Admin) List all users in the system.
 
+    The response carries an ETag. An admin page that polls this endpoint can
+    send it back in If-None-Match and gets an empty 304 while nothing has
+    changed, instead of the whole list again.
+
     Returns:
         Dictionary of users with their info (no password hashes)
     """
+    global _users_response_cache
+
     if not auth_service:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Authentication service not available"
         )
 
-    users = auth_service.list_users()
+    signature = _users_file_signature(auth_service)
+    cached = _users_response_cache
+    if cached is None or cached[0] != signature:
+        users = auth_service.list_users()
+        body = json.dumps(
+            {"status": "success", "users": list(users.values())}).encode("utf-8")
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        cached = _users_response_cache = (signature, body, etag)
+    _, body, etag = cached
+
+    # no-cache: the browser may keep the copy but must revalidate each time,
+    # so a newly created user shows up immediately
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
     logger.info(f"Admin {admin_user.get('sub')} listed users")
-    return {"status": "success", "users": list(users.values())}
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("/users/create", response_model=schemas.StandardResponse)
 async def create_user(
-    username: str = Form(...),
-    password: str = Form(...),
-    is_admin: bool = Form(False),
-    admin_user: dict = Depends(get_current_admin_user),
-    auth_service: UserAuth = Depends(get_user_auth)
+    username: Annotated[str, Form()],
+    password: Annotated[str, Form()],
+    admin_user: AdminUser,
+    auth_service: UserAuthDep,
+    is_admin: Annotated[bool, Form()] = False
 ):
     """
     (Admin) Create a new user account.
@@ -157,35 +320,33 @@ async def create_user(
             detail="Authentication service not available"
         )
 
-    # Check if user already exists
-    existing_users = auth_service._load_users()
-    if username in existing_users:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"User '{username}' already exists"
-        )
-
-    # Create the user
-    success = auth_service.create_user_password(username, password)
+    # Create the user - the "already exists" check happens in the same
+    # locked read/write of the users file.
+    # bcrypt is deliberately slow - hash in a worker thread
+    success, reason = await run_in_threadpool(
+        auth_service.upsert_user, username, password, must_not_exist=True)
     if not success:
+        if reason == "exists":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"User '{username}' already exists"
+            )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create user"
         )
 
+    _invalidate_users_cache()
     logger.info(f"Admin {admin_user.get('sub')} created user: {username}")
-    return {
-        "status": "success",
-        "message": f"User '{username}' created successfully"
-    }
+    return _success(f"User '{username}' created successfully")
 
 
 @router.post("/users/{username}/reset-password", response_model=schemas.StandardResponse)
 async def admin_reset_user_password(
     username: str,
-    new_password: str = Form(...),
-    admin_user: dict = Depends(get_current_admin_user),
-    auth_service: UserAuth = Depends(get_user_auth)
+    new_password: Annotated[str, Form()],
+    admin_user: AdminUser,
+    auth_service: UserAuthDep
 ):
     """
     (Admin) Reset a user's password without requiring reset token.
@@ -205,34 +366,32 @@ async def admin_reset_user_password(
             detail="Authentication service not available"
         )
 
-    # Check if user exists
-    existing_users = auth_service._load_users()
-    if username not in existing_users:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"User '{username}' not found"
-        )
-
-    # Update the password
-    success = auth_service.create_user_password(username, new_password)
+    # Update the password - only if the user exists, checked in the same
+    # locked read/write of the users file.
+    # bcrypt is deliberately slow - hash in a worker thread
+    success, reason = await run_in_threadpool(
+        auth_service.upsert_user, username, new_password, must_exist=True)
     if not success:
+        if reason == "not_found":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User '{username}' not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to reset password"
         )
 
+    _invalidate_users_cache()
     logger.info(f"Admin {admin_user.get('sub')} reset password for user: {username}")
-    return {
-        "status": "success",
-        "message": f"Password reset successfully for '{username}'"
-    }
+    return _success(f"Password reset successfully for '{username}'")
 
 
 @router.delete("/users/{username}", response_model=schemas.StandardResponse)
 async def delete_user(
     username: str,
-    admin_user: dict = Depends(get_current_admin_user),
-    auth_service: UserAuth = Depends(get_user_auth)
+    admin_user: AdminUser,
+    auth_service: UserAuthDep
 ):
     """
     (Admin) Delete a user from the system.
@@ -269,23 +428,122 @@ async def delete_user(
             detail=f"User '{username}' not found"
         )
 
+    _invalidate_users_cache()
     logger.info(f"Admin {admin_user.get('sub')} deleted user: {username}")
-    return {
-        "status": "success",
-        "message": f"User '{username}' deleted successfully"
-    }
+    return _success(f"User '{username}' deleted successfully")
 
 
 # ============================================================================
 # REPOSITORY MANAGEMENT ENDPOINTS
 # ============================================================================
 
+def _fast_rmtree(root: str):
+    """
+    Delete a directory tree in one bottom-up pass.
+
+    Git marks its object and pack files read-only. On Windows those can't be
+    deleted until the read-only flag is cleared, so shutil.rmtree fails on
+    each one, raises, calls the error handler, and tries again. Here the flag
+    is cleared up front (os.chmod is SetFileAttributesW on Windows), so every
+    file is deleted on the first try. On Linux/macOS the file mode doesn't
+    matter for deletion, so files are simply unlinked.
+
+    Any error is raised to the caller (the reset's retry loop).
+    """
+    clear_readonly = sys.platform == "win32"
+
+    def _raise(error):
+        raise error
+
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False, onerror=_raise):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if clear_readonly:
+                os.chmod(path, stat.S_IWRITE)
+            os.unlink(path)
+        for name in dirnames:
+            # Symlinks to folders are listed here but never walked into
+            path = os.path.join(dirpath, name)
+            if os.path.islink(path):
+                os.unlink(path)
+        os.rmdir(dirpath)
+
+
+def _terminate_git_processes(timeout: float = 3.0):
+    """
+    Stop every running git / git-lfs process, all at once.
+
+    All of them are asked to terminate first, then we wait for the whole
+    group with ONE shared timeout (psutil.wait_procs), and anything still
+    alive after that is killed. N processes cost at most ~timeout seconds
+    in total, not timeout seconds each.
+    """
+    procs = []
+    for proc, name in _iter_git_processes():
+        try:
+            proc.terminate()
+            procs.append(proc)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    if not procs:
+        return
+
+    gone, alive = psutil.wait_procs(procs, timeout=timeout)
+    for proc in alive:
+        try:
+            proc.kill()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    if alive:
+        psutil.wait_procs(alive, timeout=timeout)
+    logger.info(f"Terminated {len(gone)} git process(es), killed {len(alive)}")
+
+
+# Retry timing for deleting the repository during a reset (seconds)
+RESET_DELETE_FIRST_DELAY = 0.05
+RESET_DELETE_MAX_DELAY = 0.5
+RESET_DELETE_BUDGET = 5.0
+
+_GIT_PROCESS_NAMES = frozenset({'git.exe', 'git-lfs.exe', 'git', 'git-lfs'})
+
+
+def _iter_git_processes():
+    """
+    Yield (psutil.Process, name) for every running git / git-lfs process.
+
+    On Linux the name is read straight from /proc/<pid>/comm - one tiny read
+    per process - and a psutil.Process is only built for the matches.
+    Elsewhere (Windows, macOS) psutil.process_iter is used, fetching only
+    the 'name' attribute.
+    """
+    if os.path.isdir('/proc'):
+        for pid in os.listdir('/proc'):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f'/proc/{pid}/comm') as f:
+                    name = f.read().strip()
+            except OSError:
+                # Process exited, or we aren't allowed to look at it
+                continue
+            if name in _GIT_PROCESS_NAMES:
+                try:
+                    yield psutil.Process(int(pid)), name
+                except psutil.Error:
+                    continue
+    else:
+        for proc in psutil.process_iter(['name']):
+            name = proc.info['name']
+            if name in _GIT_PROCESS_NAMES:
+                yield proc, name
+
+
 @router.post("/reset_repository", response_model=schemas.StandardResponse)
 async def reset_repository(
     request: Request,
-    admin_user: dict = Depends(get_current_admin_user),
-    git_repo: GitRepository = Depends(get_git_repo),
-    config_manager: ConfigManager = Depends(get_config_manager)
+    admin_user: AdminUser,
+    git_repo: GitRepoDep,
+    config_manager: ConfigManagerDep
 ):
     """
     (Admin) Reset the local repository to match GitLab exactly.
@@ -306,57 +564,66 @@ async def reset_repository(
             detail="Repository not initialized"
         )
 
+    if _reset_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A repository reset is already in progress"
+        )
+
     repo_path = git_repo.repo_path
     logger.info(f"Admin {admin_user.get('sub')} resetting repository at {repo_path}")
 
-    try:
-        # Step 1: Terminate any Git processes that might have file handles open
-        for proc in psutil.process_iter(['name']):
-            try:
-                if proc.info['name'] in ['git.exe', 'git-lfs.exe', 'git', 'git-lfs']:
-                    proc.terminate()
-                    proc.wait(timeout=3)
-                    logger.info(f"Terminated process {proc.info['name']}")
-            except (psutil.NoSuchProcess, psutil.TimeoutExpired, psutil.AccessDenied):
-                pass
-
-        # Step 2: Delete the repository directory
-        def handle_remove_readonly(func, path, exc_info):
-            """Handle read-only files during deletion"""
-            try:
-                Path(path).chmod(stat.S_IWRITE)
-                func(path)
-            except Exception as chmod_error:
-                logger.error(f"Failed to handle readonly file {path}: {chmod_error}")
-
-        # Try multiple times in case of file locks
-        last_error = None
-        for attempt in range(3):
-            try:
-                if repo_path.exists():
-                    shutil.rmtree(repo_path, onerror=handle_remove_readonly)
-                    logger.info(f"Deleted repository directory: {repo_path}")
-                break
-            except Exception as delete_error:
-                last_error = delete_error
-                logger.warning(f"Retry {attempt+1}/3 deleting repo: {delete_error}")
-                import time
-                time.sleep(1)
-        else:
-            raise Exception(f"Could not delete repository after 3 attempts: {last_error}")
+    def _do_reset():
+        """Blocking part of the reset; runs in a worker thread."""
+        # Hold the repository for the whole reset: in-flight check-ins and
+        # reads finish first, and requests arriving meanwhile get a 503 from
+        # get_git_repo instead of finding a half-deleted working tree
+        with git_repo.exclusive_access():
+            # Step 1: Terminate any Git processes that might have file handles open
+            _terminate_git_processes()
+
+            # Step 2: Delete the repository directory
+            # Retry in case of file locks (e.g. a just-killed git.exe on Windows
+            # still releasing its handles). Back off exponentially - 0.05s,
+            # 0.1s, 0.2s... capped at RESET_DELETE_MAX_DELAY - so the usual case
+            # of handles clearing quickly doesn't wait a full second, while slow
+            # ones still get up to RESET_DELETE_BUDGET seconds in total.
+            last_error = None
+            delay = RESET_DELETE_FIRST_DELAY
+            deadline = time.monotonic() + RESET_DELETE_BUDGET
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    if repo_path.exists():
+                        _fast_rmtree(str(repo_path))
+                        logger.info(f"Deleted repository directory: {repo_path}")
+                    break
+                except Exception as delete_error:
+                    last_error = delete_error
+                    if time.monotonic() + delay > deadline:
+                        raise Exception(
+                            f"Could not delete repository after {attempt} attempts: {last_error}")
+                    logger.warning(f"Retry {attempt} deleting repo in {delay:.2f}s: {delete_error}")
+                    time.sleep(delay)
+                    delay = min(delay * 2, RESET_DELETE_MAX_DELAY)
+
+            # Step 3: Reinitialize the repository
+            # The GitRepository class will clone from GitLab again
+            # The old Repo's cat-file processes were killed with the rest,
+            # so swap in the fresh one and drop everything read through it
+            git_repo.repo = git_repo._init_repo()
+            git_repo.invalidate_meta_snapshot()
+            logger.info("Repository reset and reinitialized successfully")
 
-        # Step 3: Reinitialize the repository
-        # The GitRepository class will clone from GitLab again
-        git_repo._init_repo()
-        logger.info("Repository reset and reinitialized successfully")
+    try:
+        async with _reset_lock:
+            await run_in_threadpool(_do_reset)
 
         # Update the app state to reflect the reset
         request.app.state.git_repo = git_repo
 
-        return {
-            "status": "success",
-            "message": "Repository has been reset and synchronized with GitLab"
-        }
+        return _success("Repository has been reset and synchronized with GitLab")
 
     except Exception as e:
         logger.error(f"Repository reset failed: {e}", exc_info=True)
@@ -366,10 +633,68 @@ async def reset_repository(
         )
 
 
+# ============================================================================
+# BACKUP HELPERS
+# ============================================================================
+
+# Git object and LFS object files are content-addressed: once written they are
+# never modified, only added or deleted. That makes them safe to hardlink into
+# a backup. Everything else (working files, lock files, .meta.json, index...)
+# can be rewritten in place, so it must be a real copy.
+_IMMUTABLE_DIRS = (
+    os.sep + os.path.join(".git", "objects") + os.sep,
+    os.sep + os.path.join(".git", "lfs", "objects") + os.sep,
+)
+
+
+def _link_or_copy(src: str, dst: str):
+    """copytree copy_function: hardlink immutable Git objects, copy the rest."""
+    if any(part in src for part in _IMMUTABLE_DIRS):
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            # Different drive, or the filesystem doesn't support hardlinks
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _fast_clone(src: Path, dst: Path):
+    """
+    Copy the repository at src to dst as cheaply as the filesystem allows.
+
+    1. Copy-on-write clone (reflink) via cp: Btrfs/XFS on Linux, APFS on
+       macOS. Only metadata is written; data blocks are shared until changed.
+    2. Otherwise copytree, hardlinking the immutable Git/LFS objects (which
+       are usually most of the repository's size) and copying everything
+       else byte for byte.
+    """
+    if sys.platform.startswith("linux"):
+        clone_cmd = ["cp", "-a", "--reflink=always", str(src), str(dst)]
+    elif sys.platform == "darwin":
+        clone_cmd = ["cp", "-c", "-R", "-p", str(src), str(dst)]
+    else:
+        clone_cmd = None
+
+    if clone_cmd:
+        try:
+            result = subprocess.run(clone_cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                logger.info(f"Backup created as copy-on-write clone: {dst}")
+                return
+            logger.info(f"Copy-on-write clone not available: {result.stderr.strip()}")
+        except OSError as e:
+            logger.info(f"Copy-on-write clone not available: {e}")
+        # cp may have left a partial tree behind
+        shutil.rmtree(dst, ignore_errors=True)
+
+    shutil.copytree(src, dst, symlinks=True, copy_function=_link_or_copy)
+
+
 @router.post("/create_backup", response_model=schemas.StandardResponse)
 async def create_backup(
-    admin_user: dict = Depends(get_current_admin_user),
-    git_repo: GitRepository = Depends(get_git_repo)
+    admin_user: AdminUser,
+    git_repo: GitRepoDep
 ):
     """
     (Admin) Create a manual backup of the entire repository.
@@ -385,6 +710,12 @@ async def create_backup(
             detail="Repository not initialized"
         )
 
+    if _backup_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A backup is already in progress"
+        )
+
     try:
         # Create backup directory in user's home
         backup_dir = Path.home() / 'MastercamBackups'
@@ -395,16 +726,17 @@ async def create_backup(
         backup_name = f'mastercam_backup_{timestamp}'
         backup_path = backup_dir / backup_name
 
-        # Copy the entire repository
+        # Copy the entire repository (in a worker thread - this can take a
+        # while and must not block other requests)
         logger.info(f"Creating backup at {backup_path}")
-        shutil.copytree(git_repo.repo_path, backup_path)
+        async with _backup_lock:
+            await run_in_threadpool(_fast_clone, git_repo.repo_path, backup_path)
 
         logger.info(f"Backup created successfully by {admin_user.get('sub')}")
-        return {
-            "status": "success",
-            "message": f"Backup created successfully",
-            "backup_path": str(backup_path)
-        }
+        return _success(
+            f"Backup created successfully",
+            backup_path=str(backup_path)
+        )
 
     except Exception as e:
         logger.error(f"Backup creation failed: {e}", exc_info=True)
@@ -414,10 +746,64 @@ async def create_backup(
         )
 
 
+# How many of the last output lines of a long-running command to keep
+COMMAND_OUTPUT_TAIL_LINES = 64
+
+
+async def _run_command_tail(cmd: list, cwd: str, timeout: float) -> tuple:
+    """
+    Run a command without blocking the event loop and keep only its last lines.
+
+    stdout and stderr are merged and read line by line as the command runs,
+    into a ring buffer of COMMAND_OUTPUT_TAIL_LINES lines, so a chatty
+    command can't use unbounded memory.
+
+    Returns:
+        (returncode, output) where output is the tail of the combined output
+
+    Raises:
+        subprocess.TimeoutExpired: If the command ran longer than timeout
+            (it is killed first)
+    """
+    tail = deque(maxlen=COMMAND_OUTPUT_TAIL_LINES)
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    except NotImplementedError:
+        # Windows' SelectorEventLoop (what uvicorn uses with reload=True) has
+        # no subprocess support - fall back to a worker thread
+        result = await run_in_threadpool(
+            subprocess.run, cmd, cwd=cwd,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, errors='replace', timeout=timeout,
+        )
+        tail.extend(result.stdout.splitlines(keepends=True))
+        return result.returncode, ''.join(tail)
+
+    async def _drain():
+        async for line in proc.stdout:
+            tail.append(line.decode('utf-8', 'replace'))
+        return await proc.wait()
+
+    try:
+        returncode = await asyncio.wait_for(_drain(), timeout)
+    except asyncio.TimeoutError:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    finally:
+        # Timed out, or the request was cancelled: don't leave it running
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    return returncode, ''.join(tail)
+
+
 @router.post("/cleanup_lfs", response_model=schemas.StandardResponse)
 async def cleanup_lfs(
-    admin_user: dict = Depends(get_current_admin_user),
-    git_repo: GitRepository = Depends(get_git_repo)
+    admin_user: AdminUser,
+    git_repo: GitRepoDep
 ):
     """
     (Admin) Clean up old Git LFS files to free disk space.
@@ -436,24 +822,21 @@ async def cleanup_lfs(
     try:
         logger.info(f"Admin {admin_user.get('sub')} initiating LFS cleanup")
 
-        # Run git lfs prune command
-        result = subprocess.run(
+        # Run git lfs prune command (can take minutes)
+        returncode, output = await _run_command_tail(
             ['git', 'lfs', 'prune'],
-            cwd=git_repo.repo_path,
-            capture_output=True,
-            text=True,
+            cwd=str(git_repo.repo_path),
             timeout=300  # 5 minute timeout
         )
 
-        if result.returncode != 0:
-            raise Exception(f"LFS prune failed: {result.stderr}")
+        if returncode != 0:
+            raise Exception(f"LFS prune failed: {output}")
 
         logger.info("LFS cleanup completed successfully")
-        return {
-            "status": "success",
-            "message": "LFS cleanup completed successfully",
-            "output": result.stdout
-        }
+        return _success(
+            "LFS cleanup completed successfully",
+            output=output
+        )
 
     except subprocess.TimeoutExpired:
         logger.error("LFS cleanup timed out after 5 minutes")
@@ -469,16 +852,270 @@ async def cleanup_lfs(
         )
 
 
+# ============================================================================
+# REPOSITORY EXPORT HELPERS
+# ============================================================================
+
+# Bytes read from each file per step while streaming the export ZIP
+EXPORT_CHUNK_SIZE = 1024 * 1024
+
+# Files that are already compressed (archives, images, Mastercam part files)
+# gain next to nothing from DEFLATE but still cost all its CPU time, so they
+# are stored as-is. Everything else is deflated at level 1: much faster than
+# zlib's default of 6, and most of the size win on text-like data.
+EXPORT_INCOMPRESSIBLE = frozenset({
+    '.zip', '.7z', '.gz', '.rar', '.png', '.jpg', '.jpeg',
+    '.mcam', '.emcam', '.mcx', '.stl',
+})
+EXPORT_COMPRESS_LEVEL = 1
+
+# Parallel compression for the export. Files up to EXPORT_PARALLEL_MAX_SIZE
+# are read and deflated by EXPORT_WORKERS threads, at most
+# EXPORT_PARALLEL_AHEAD files ahead of the one being written.
+EXPORT_WORKERS = min(8, os.cpu_count() or 1)
+EXPORT_PARALLEL_AHEAD = EXPORT_WORKERS * 2
+EXPORT_PARALLEL_MAX_SIZE = 4 * 1024 * 1024
+
+
+def _iter_repo_files(root: str):
+    """
+    Yield (full_path, archive_name) for every file under root, skipping .git.
+
+    Walks with os.scandir and a stack, so files are produced as they are found
+    instead of building the whole path list first (as rglob('*') would).
+    Archive names always use '/' like the ZIP format expects.
+    """
+    stack = [(root, "")]
+    while stack:
+        folder, prefix = stack.pop()
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name == ".git":
+                    continue
+                arcname = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, arcname + "/"))
+                elif entry.is_file():
+                    yield entry.path, arcname
+
+
+class _ZipChunkSink(io.RawIOBase):
+    """
+    Write-only file object that zipfile writes into.
+
+    It isn't seekable, so zipfile switches to streaming mode (sizes and CRCs
+    go in data descriptors after each file). The written bytes are collected
+    until the generator below drains them and sends them to the client.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class _Precompressed:
+    """
+    Stands in for zipfile's DEFLATE compressor when the data was already
+    deflated in a worker thread.
+
+    zipfile still sees the original bytes go through write() - so it computes
+    the CRC and size itself - but the compressed output is the one we made.
+    """
+
+    def __init__(self, compressed: bytes):
+        self._compressed = compressed
+
+    def compress(self, data):
+        return b""
+
+    def flush(self):
+        return self._compressed
+
+
+def _read_and_deflate(full_path: str, compress_type: int):
+    """Worker: read a (small) file and deflate it. zlib releases the GIL."""
+    with open(full_path, "rb") as f:
+        raw = f.read()
+    if compress_type != zipfile.ZIP_DEFLATED:
+        return raw, None
+    # Raw DEFLATE stream (wbits=-15), exactly what zipfile itself writes
+    compressor = zlib.compressobj(EXPORT_COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    return raw, compressor.compress(raw) + compressor.flush()
+
+
+def _write_entry(zipf, sink, zinfo, full_path, future):
+    """Write one file into the ZIP, yielding output as it becomes available."""
+    if future is not None:
+        raw, compressed = future.result()
+        with zipf.open(zinfo, "w") as dest:
+            if compressed is not None:
+                dest._compressor = _Precompressed(compressed)
+            dest.write(raw)
+    else:
+        # Big file: stream it in chunks so it is never fully in memory
+        with open(full_path, "rb") as src, zipf.open(zinfo, "w") as dest:
+            while chunk := src.read(EXPORT_CHUNK_SIZE):
+                dest.write(chunk)
+                data = sink.drain()
+                if data:
+                    yield data
+    data = sink.drain()
+    if data:
+        yield data
+
+
+def _stream_repo_zip(root: str):
+    """
+    Generate the bytes of a ZIP of the repository, chunk by chunk.
+
+    Nothing is written to disk. This is a plain (sync) generator:
+    StreamingResponse iterates it in a worker thread, so the directory walk,
+    file reads and compression never run on the event loop.
+
+    Small files are read and deflated ahead of time by a thread pool (one
+    file per task), while this thread writes the finished entries into the
+    ZIP in order. Only EXPORT_PARALLEL_AHEAD files are in flight at once and
+    only files up to EXPORT_PARALLEL_MAX_SIZE go to the pool, which bounds
+    the memory used. Bigger files are streamed through zipfile in chunks.
+    """
+    sink = _ZipChunkSink()
+    pending = deque()  # (zinfo, full_path, future or None), in ZIP order
+    pool = ThreadPoolExecutor(max_workers=EXPORT_WORKERS)
+    try:
+        with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zipf:
+            for full_path, arcname in _iter_repo_files(root):
+                zinfo = zipfile.ZipInfo.from_file(full_path, arcname)
+                if os.path.splitext(arcname)[1].lower() in EXPORT_INCOMPRESSIBLE:
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                else:
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    # No public per-entry compresslevel before Python 3.13
+                    zinfo._compresslevel = EXPORT_COMPRESS_LEVEL
+
+                future = None
+                if zinfo.file_size <= EXPORT_PARALLEL_MAX_SIZE:
+                    future = pool.submit(
+                        _read_and_deflate, full_path, zinfo.compress_type)
+                pending.append((zinfo, full_path, future))
+
+                while len(pending) > EXPORT_PARALLEL_AHEAD:
+                    yield from _write_entry(zipf, sink, *pending.popleft())
+
+            while pending:
+                yield from _write_entry(zipf, sink, *pending.popleft())
+        # Closing the ZipFile writes the central directory
+        yield sink.drain()
+    except Exception as e:
+        # Headers are already sent, so all we can do is log and cut the stream
+        logger.error(f"Repository export failed mid-stream: {e}", exc_info=True)
+        raise
+    finally:
+        # Also runs if the client disconnects and the generator is closed
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _export_releaser():
+    """
+    Return a function that releases _export_lock, and does so only once.
+
+    The streaming code and the response's background task both call it:
+    the generator's finally covers errors mid-stream, the background task
+    covers a client that disconnects before the body is even started (a
+    generator that never ran never reaches its finally).
+    """
+    released = False
+    guard = threading.Lock()
+
+    def release():
+        nonlocal released
+        with guard:
+            if not released:
+                released = True
+                _export_lock.release()
+    return release
+
+
+def _hold_while_streaming(chunks, release):
+    """Pass the chunks through, releasing the export lock at the end."""
+    try:
+        yield from chunks
+    finally:
+        release()
+
+
+def _start_git_archive(repo_dir: str, env: dict):
+    """
+    Start `git archive --format=zip HEAD` and read its first chunk.
+
+    Reading the first chunk here (before any response is sent) means a
+    failure such as an empty repository can still become a proper error.
+
+    Returns:
+        (proc, first_chunk, stderr_file)
+    """
+    # stderr goes to a temp file, not a pipe: nobody reads a stderr pipe
+    # while we stream stdout, and a full pipe would hang git
+    stderr_file = tempfile.TemporaryFile()
+    proc = subprocess.Popen(
+        ['git', 'archive', '--format=zip', 'HEAD'],
+        cwd=repo_dir, env=env,
+        stdout=subprocess.PIPE, stderr=stderr_file,
+    )
+    return proc, proc.stdout.read(EXPORT_CHUNK_SIZE), stderr_file
+
+
+def _read_stderr(stderr_file) -> str:
+    stderr_file.seek(0)
+    return stderr_file.read().decode('utf-8', 'replace').strip()
+
+
+def _stream_git_archive(proc, first_chunk: bytes, stderr_file):
+    """Yield git archive's ZIP output; iterated in a worker thread."""
+    try:
+        chunk = first_chunk
+        while chunk:
+            yield chunk
+            chunk = proc.stdout.read(EXPORT_CHUNK_SIZE)
+        if proc.wait() != 0:
+            logger.error(f"git archive failed mid-stream: {_read_stderr(stderr_file)}")
+    finally:
+        # Also runs if the client disconnects
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        stderr_file.close()
+
+
 @router.post("/export_repository")
 async def export_repository(
-    admin_user: dict = Depends(get_current_admin_user),
-    git_repo: GitRepository = Depends(get_git_repo)
+    admin_user: AdminUser,
+    git_repo: GitRepoDep,
+    source: Literal["worktree", "head"] = "worktree"
 ):
     """
     (Admin) Export the repository as a ZIP file.
 
-    Creates a ZIP archive of the repository (excluding .git folder)
-    and returns it as a downloadable file.
+    Streams a ZIP archive of the repository (excluding .git folder) straight
+    to the client as it is compressed - no temporary file is built first.
+
+    Args:
+        source: What to export
+            - "worktree" (default): the files as they are on disk now
+            - "head": the last commit, built by `git archive` (native code,
+              much faster). Uncommitted changes are not included, and
+              Git LFS files come out as their small pointer files.
 
     Returns:
         ZIP file download
@@ -489,40 +1126,198 @@ async def export_repository(
             detail="Repository not initialized"
         )
 
-    try:
-        import tempfile
-        import zipfile
+    if not _export_lock.acquire(blocking=False):
+        raise _EXC_EXPORT_BUSY.with_traceback(None)
+    release = _export_releaser()
 
-        logger.info(f"Admin {admin_user.get('sub')} exporting repository")
+    try:
+        logger.info(f"Admin {admin_user.get('sub')} exporting repository ({source})")
 
-        # Create temporary ZIP file
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         zip_filename = f"mastercam_export_{timestamp}.zip"
-        temp_zip_path = Path(tempfile.gettempdir()) / zip_filename
+        headers = {"Content-Disposition": f'attachment; filename="{zip_filename}"'}
+
+        if source == "head":
+            proc, first_chunk, stderr_file = await run_in_threadpool(
+                _start_git_archive, str(git_repo.repo_path), git_repo.git_env)
+            if not first_chunk:
+                await run_in_threadpool(proc.wait)
+                error = _read_stderr(stderr_file)
+                proc.stdout.close()
+                stderr_file.close()
+                logger.error(f"git archive failed: {error}")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Repository export failed: {error}"
+                )
+            chunks = _stream_git_archive(proc, first_chunk, stderr_file)
+        else:
+            chunks = _stream_repo_zip(str(git_repo.repo_path))
+    except BaseException:
+        release()
+        raise
+
+    # No Content-Length: the compressed size isn't known until the end,
+    # so the response goes out with chunked transfer encoding
+    return StreamingResponse(
+        _hold_while_streaming(chunks, release),
+        media_type='application/zip',
+        headers=headers,
+        background=BackgroundTask(release)
+    )
 
-        # Create ZIP archive
-        with zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in git_repo.repo_path.rglob('*'):
-                # Skip .git directory
-                if '.git' in file_path.parts:
-                    continue
 
-                if file_path.is_file():
-                    arcname = file_path.relative_to(git_repo.repo_path)
-                    zipf.write(file_path, arcname)
+# ============================================================================
+# BACKGROUND EXPORT JOBS
+# ============================================================================
+# For very large repositories a single streaming request can outlive a proxy
+# or browser timeout. These endpoints decouple the two: POST starts a job and
+# returns at once, the ZIP is built into a temp file in the background, and
+# GET polls the job (202 while running) and downloads the file when done.
+#
+# Jobs live in memory: {job_id: {"status", "path", "filename", "error",
+# "created", "admin", "task"}}. Finished files are kept for EXPORT_JOB_TTL
+# seconds so a download can be retried, then deleted. A job still running
+# after that long is dropped as well.
+
+EXPORT_JOB_TTL = 3600
+
+_export_jobs: dict = {}
+
+
+def _purge_export_jobs():
+    """Forget jobs older than EXPORT_JOB_TTL and delete their files."""
+    cutoff = time.time() - EXPORT_JOB_TTL
+    for job_id, job in list(_export_jobs.items()):
+        if job["created"] < cutoff:
+            if job["status"] == "running":
+                logger.warning(f"Export job {job_id} still running after {EXPORT_JOB_TTL}s, dropping it")
+            if job["path"]:
+                try:
+                    os.unlink(job["path"])
+                except OSError:
+                    # Already gone, or (on Windows) still open by a build
+                    pass
+            del _export_jobs[job_id]
+
+
+def _build_export_zip(job: dict, repo_dir: str):
+    """Worker thread: write the repository ZIP into the job's temp file."""
+    try:
+        with open(job["path"], "wb") as f:
+            for chunk in _stream_repo_zip(repo_dir):
+                f.write(chunk)
+        job["status"] = "done"
+        logger.info(f"Export job finished: {job['path']}")
+    except Exception as e:
+        # _stream_repo_zip has already logged the details
+        job["status"] = "failed"
+        job["error"] = str(e)
+
 
-        logger.info(f"Repository exported to {temp_zip_path}")
+def _finish_export_job(job: dict, task: asyncio.Task):
+    """Done-callback of a job's task: release _export_lock, however it ended."""
+    _export_lock.release()
+    if job["status"] == "running":
+        # Cancelled (e.g. at shutdown) before the build could finish
+        job["status"] = "failed"
+        job["error"] = "Export was cancelled"
 
-        # Return the ZIP file as a download
-        return FileResponse(
-            path=temp_zip_path,
-            filename=zip_filename,
-            media_type='application/zip'
+
+@router.post("/export_jobs", status_code=status.HTTP_202_ACCEPTED)
+async def start_export_job(
+    admin_user: AdminUser,
+    git_repo: GitRepoDep
+):
+    """
+    (Admin) Start building a repository ZIP in the background.
+
+    Returns:
+        The job id and the URL to poll for the result
+    """
+    if not git_repo:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Repository not initialized"
         )
 
-    except Exception as e:
-        logger.error(f"Repository export failed: {e}", exc_info=True)
+    _purge_export_jobs()
+
+    # Held until the job's task finishes (see _finish_export_job)
+    if not _export_lock.acquire(blocking=False):
+        raise _EXC_EXPORT_BUSY.with_traceback(None)
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    try:
+        fd, path = tempfile.mkstemp(prefix="mastercam_export_", suffix=".zip")
+        os.close(fd)
+    except BaseException:
+        _export_lock.release()
+        raise
+
+    job_id = secrets.token_urlsafe(12)
+    job = {
+        "status": "running",
+        "path": path,
+        "filename": f"mastercam_export_{timestamp}.zip",
+        "error": None,
+        "created": time.time(),
+        "admin": admin_user.get('sub'),
+    }
+    _export_jobs[job_id] = job
+
+    # Started as its own task rather than a response background task: those
+    # are skipped when sending the 202 fails (e.g. the client disconnected),
+    # which would leave the job running and _export_lock held forever. The
+    # job keeps the reference so the task isn't garbage-collected mid-run.
+    job["task"] = asyncio.create_task(
+        run_in_threadpool(_build_export_zip, job, str(git_repo.repo_path)))
+    job["task"].add_done_callback(functools.partial(_finish_export_job, job))
+    logger.info(f"Admin {admin_user.get('sub')} started export job {job_id}")
+
+    return {
+        "job_id": job_id,
+        "status": "running",
+        "poll_url": f"{router.prefix}/export_jobs/{job_id}"
+    }
+
+
+@router.get("/export_jobs/{job_id}")
+async def get_export_job(
+    job_id: str,
+    admin_user: AdminUser
+):
+    """
+    (Admin) Poll an export job; downloads the ZIP once it is ready.
+
+    Returns:
+        202 with the job status while running, the ZIP file when done
+
+    Raises:
+        404: Unknown (or expired) job
+        500: The export failed
+    """
+    job = _export_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export job not found"
+        )
+
+    if job["status"] == "running":
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"job_id": job_id, "status": "running"}
+        )
+
+    if job["status"] == "failed":
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Repository export failed: {str(e)}"
+            detail=f"Repository export failed: {job['error']}"
         )
+
+    return FileResponse(
+        path=job["path"],
+        filename=job["filename"],
+        media_type='application/zip'
+    )
@@ -7,30 +7,492 @@ Provides endpoints for:
 - Managing filename patterns
 - Managing repository configurations
 - Managing user access control
+- Applying several edits with a single save (bulk)
 """
 
+import functools
+import hashlib
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+import re
+import time
+from dataclasses import dataclass
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter, ValidationError
+from typing import Any, Callable, Dict, List, Tuple
 
 from app.models.schemas import (
     PDMAdminConfig,
     AdminConfigUpdateRequest,
+    AdminConfigOperation,
+    AdminConfigBulkRequest,
     FileNamePattern,
     RepositoryConfig,
     UserRepositoryAccess,
     StandardResponse
 )
-from app.services.admin_config_service import AdminConfigService
+from app.services.admin_config_service import AdminConfigService, ConfigIndex
 from app.api.dependencies import get_current_admin_user, get_admin_config_service
+from app.api.responses import FastJSONResponse
+from app.api.routers.websocket import broadcast_config_update
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/admin/config", tags=["admin-config"])
+# Responses without a cached body (StandardResponse from the edit routes,
+# errors) are encoded with orjson when it's installed
+router = APIRouter(
+    prefix="/admin/config",
+    tags=["admin-config"],
+    default_response_class=FastJSONResponse,
+)
+
+
+# ===== Error handling =====
+
+def handle_errors(log_message: str, detail_prefix: str = ""):
+    """
+    Turn unexpected exceptions in a route into a logged HTTP 500.
+
+    Every route here used to end with the same tail:
+
+        except HTTPException:
+            raise                   # deliberate 400/404/... pass through
+        except Exception as e:
+            logger.error(...)
+            raise HTTPException(500, detail=str(e))
+
+    This decorator is that tail, written once. Put it under @router.*:
+
+        @router.get("/thing")
+        @handle_errors("Error getting thing")
+        async def get_thing(...):
+            ...
+
+    functools.wraps keeps the route's signature visible to FastAPI, so
+    its parameters and dependencies resolve exactly as before.
+
+    Args:
+        log_message: Logged (with traceback) when the route fails
+        detail_prefix: Prepended to str(e) in the 500 response's detail
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error("%s: %s", log_message, e, exc_info=True)
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"{detail_prefix}{e}"
+                )
+        return wrapper
+    return decorator
+
+
+# ===== Response cache for the GET endpoints =====
+# The admin dashboard polls these GETs, and each one used to re-dump the
+# Pydantic models to JSON on every call. Instead we keep the serialized
+# bytes per endpoint and hand them back as-is while they are still valid.
+#
+# An entry is valid while BOTH hold:
+#   - it is younger than its endpoint's CachePolicy allows (see below)
+#   - the service's config generation hasn't changed since it was built.
+#     save_config()/load_config() bump the generation, so every POST/DELETE
+#     here (and every config pulled from GitLab) invalidates the cache
+#     without the routes having to clear it by hand.
+#
+# Keys that depend on the caller (/my-repositories) include the username so
+# one user's answer is never served to another.
+#
+# Each entry also carries an ETag (hash of the body): clients that poll
+# with If-None-Match get an empty 304 while the config is unchanged.
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    How long an endpoint's cached body may live.
+
+    The generation check already drops entries as soon as the config
+    changes in this process, so the TTL is the safety net for everything
+    else (per-user views, anything the generation can't see). It is matched
+    to how volatile each endpoint's data is:
+
+        ttl = clamp(generation_time + buffer, min_ttl, max_ttl)
+
+    where generation_time is how long building the body took - an
+    expensive body is worth keeping a little longer.
+    """
+    name: str
+    min_ttl: float
+    max_ttl: float
+    buffer: float
+
+    def ttl(self, generation_time: float) -> float:
+        return max(self.min_ttl, min(self.max_ttl, generation_time + self.buffer))
+
+
+# /my-repositories, /user-access: per-user access, changes most often
+SHORT_POLICY = CachePolicy("short", min_ttl=5.0, max_ttl=10.0, buffer=10.0)
+# /patterns, /repositories
+NORMAL_POLICY = CachePolicy("normal", min_ttl=15.0, max_ttl=30.0, buffer=30.0)
+# / (full config): largest payload, only changes through these routes
+LONG_POLICY = CachePolicy("long", min_ttl=30.0, max_ttl=60.0, buffer=60.0)
+
+# key -> (config generation, expires_at (monotonic), JSON body, ETag)
+_response_cache: Dict[str, Tuple[int, float, bytes, str]] = {}
+
+# TypeAdapter(Any) serializes models, lists of models and plain values
+# straight to JSON bytes in pydantic-core (Rust, on par with orjson),
+# without a model_dump() dict or a jsonable_encoder pass first
+_json_adapter = TypeAdapter(Any)
+
+
+def _json_or_304(
+    request: Request, body: bytes, etag: str, cache_state: str, policy: CachePolicy
+) -> Response:
+    """
+    Answer with `body`, or an empty 304 if the client already has it.
+
+    The ETag is a hash of the body, so a client that sends it back in
+    If-None-Match while nothing changed gets no payload at all.
+    Cache-Control "private, no-cache" lets the browser keep the copy but
+    makes it revalidate on every use - an admin's edit shows up at once.
+    (The policy TTLs apply to the server-side cache only; a browser
+    max-age would hide an edit from the admin who just made it.)
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "X-Cache": cache_state,
+        "X-Cache-Policy": policy.name,
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _cached_json(
+    request: Request,
+    key: str,
+    config_service: AdminConfigService,
+    build: Callable[[], Any],
+    policy: CachePolicy,
+) -> Response:
+    """
+    Return the JSON response for `key`, serializing `build()` only on a miss.
+
+    If loading or serializing the config fails and we still have an older
+    body for this key, that body is served instead of a 500 (marked with
+    an "X-Cache: stale-fallback" header) - an admin page showing the
+    last-known-good config beats an error page.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        key: Cache key (endpoint name, plus the username when per-user)
+        config_service: Service whose generation guards the entry
+        build: Produces the payload (a model, a list of models, ...)
+        policy: How long the serialized body may be reused
+
+    Returns:
+        Response carrying the (possibly cached) JSON body, or a 304
+    """
+    entry = _response_cache.get(key)
+    try:
+        # get_config() first: it may reload the file and bump the generation
+        config_service.get_config()
+        generation = config_service.generation
+        now = time.monotonic()
+
+        if entry is not None and entry[0] == generation and entry[1] > now:
+            return _json_or_304(request, entry[2], entry[3], "hit", policy)
+
+        body = _json_adapter.dump_json(build())
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        built_at = time.monotonic()
+        expires_at = built_at + policy.ttl(built_at - now)
+        _response_cache[key] = (generation, expires_at, body, etag)
+        return _json_or_304(request, body, etag, "miss", policy)
+    except Exception as e:
+        if entry is None:
+            raise
+        logger.warning("Serving stale '%s' response after error: %s", key, e)
+        return _json_or_304(request, entry[2], entry[3], "stale-fallback", policy)
+
+
+# ===== Config edits =====
+# Each helper applies ONE edit to a config object and raises HTTPException
+# (400/404) when the edit isn't allowed. The single-item routes and the
+# /bulk endpoint share them, so both enforce exactly the same rules.
+#
+# They are always handed the private copy yielded by
+# config_service.transaction(), never the cached config itself, so a
+# rejected edit can't leave the cache half-modified.
+#
+# Alongside the config they get a ConfigIndex of that same copy, so the
+# "does X exist?" checks are dict lookups instead of list scans. Every
+# helper that changes the config updates the index too - in a bulk request
+# later operations must see what earlier ones added or removed.
+
+def _add_pattern(config: PDMAdminConfig, index: ConfigIndex, pattern: FileNamePattern) -> str:
+    """Add a new filename pattern. Returns a success message."""
+    # Check if pattern name already exists
+    if pattern.name in index.patterns:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Pattern '{pattern.name}' already exists"
+        )
+
+    # Validate regex patterns
+    try:
+        re.compile(pattern.link_pattern)
+        re.compile(pattern.file_pattern)
+    except re.error as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid regex pattern: {e}"
+        )
+
+    config.filename_patterns.append(pattern)
+    index.patterns[pattern.name] = pattern
+    return f"Pattern '{pattern.name}' added successfully"
+
+
+def _upsert_repository(
+    config: PDMAdminConfig, index: ConfigIndex, repository: RepositoryConfig, username: str
+) -> str:
+    """Add or replace a repository configuration. Returns a success message."""
+    # Validate filename pattern exists. Checked against this copy's index
+    # rather than the service so a pattern added earlier in the same bulk
+    # request counts.
+    if repository.filename_pattern_id not in index.patterns:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Filename pattern '{repository.filename_pattern_id}' not found"
+        )
+
+    # Check if repository ID already exists
+    existing = index.repositories.get(repository.id)
+    if existing is not None:
+        # Update existing repository (in place, keeping its position)
+        config.repositories[config.repositories.index(existing)] = repository
+        index.remove_repository(existing)
+        action = "updated"
+    else:
+        # Add new repository
+        config.repositories.append(repository)
+        action = "added"
+    index.add_repository(repository)
+
+    logger.info("Repository '%s' %s by %s", repository.id, action, username)
+    return f"Repository '{repository.name}' {action} successfully"
+
+
+def _upsert_user_access(
+    config: PDMAdminConfig, index: ConfigIndex, user_access: UserRepositoryAccess
+) -> str:
+    """Add or replace a user's repository access. Returns a success message."""
+    # Validate repository IDs exist
+    for repo_id in user_access.repository_ids:
+        if repo_id not in index.repositories:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Repository ID '{repo_id}' not found"
+            )
+
+    # Validate default repository
+    if user_access.default_repository_id:
+        if user_access.default_repository_id not in user_access.repository_ids:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Default repository must be in user's access list"
+            )
+
+    # Update or add user access
+    existing = index.user_access.get(user_access.username)
+    if existing is not None:
+        config.user_access[config.user_access.index(existing)] = user_access
+        index.remove_user_access(existing)
+    else:
+        config.user_access.append(user_access)
+    index.add_user_access(user_access)
+
+    return f"User access updated for '{user_access.username}'"
+
+
+def _remove_user_access(config: PDMAdminConfig, index: ConfigIndex, username: str) -> str:
+    """Remove a user's repository access. Returns a success message."""
+    existing = index.user_access.get(username)
+    if existing is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User access for '{username}' not found"
+        )
+
+    config.user_access.remove(existing)
+    index.remove_user_access(existing)
+
+    return f"User access removed for '{username}'"
+
+
+def _delete_pattern(config: PDMAdminConfig, index: ConfigIndex, pattern_name: str) -> str:
+    """Delete a filename pattern that nothing uses. Returns a success message."""
+    # Check if pattern exists
+    if pattern_name not in index.patterns:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Pattern '{pattern_name}' not found"
+        )
+
+    # Check if this would leave zero patterns
+    if len(index.patterns) <= 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot delete the last pattern. Add a new pattern first."
+        )
+
+    # Check if any repository is using this pattern (reverse index: only
+    # the dependents are visited, not every repository)
+    repos_using = sorted(index.repositories[i].name for i in index.pattern_repos.get(pattern_name, ()))
+    if repos_using:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot delete pattern '{pattern_name}'. Used by repositories: {', '.join(repos_using)}. Change their patterns first."
+        )
+
+    config.filename_patterns.remove(index.patterns.pop(pattern_name))
+    index.pattern_repos.pop(pattern_name, None)
+    return f"Pattern '{pattern_name}' deleted successfully"
+
+
+def _delete_repository(config: PDMAdminConfig, index: ConfigIndex, repo_id: str) -> str:
+    """Delete a repository and drop it from every user's access list. Returns a success message."""
+    # Check if repository exists
+    if repo_id not in index.repositories:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Repository '{repo_id}' not found"
+        )
+
+    # CRITICAL: Prevent deleting the main repository
+    if repo_id == "main":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot delete the main repository. It is the default entry point for all users."
+        )
+
+    # Check if this would leave zero repositories
+    if len(index.repositories) <= 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot delete the last repository. Add a new repository first."
+        )
+
+    # Check if any users have this as their default repo
+    users_with_default = sorted(index.default_users.get(repo_id, ()))
+    if users_with_default:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot delete repository '{repo_id}'. It's the default for users: {', '.join(users_with_default)}. Change their defaults first."
+        )
+
+    repository = index.repositories[repo_id]
+    config.repositories.remove(repository)
+    index.remove_repository(repository)
+
+    # Remove repo from the access lists of the users that have it - the
+    # reverse index names exactly those, so other users aren't touched.
+    # repository_ids has no duplicates (see UserRepositoryAccess), so one
+    # remove() per user is enough.
+    for username in index.access_users.pop(repo_id, set()):
+        index.user_access[username].repository_ids.remove(repo_id)
+
+    return f"Repository '{repo_id}' deleted successfully"
+
+
+def _apply_operation(
+    config: PDMAdminConfig, index: ConfigIndex, operation: AdminConfigOperation, username: str
+) -> str:
+    """
+    Dispatch one bulk operation to the matching edit helper.
+
+    Returns:
+        The helper's success message
+
+    Raises:
+        HTTPException: 400 for a malformed payload, or whatever the helper raises
+    """
+    payload = operation.payload
+    try:
+        if operation.op == "add":
+            if operation.target == "pattern":
+                return _add_pattern(config, index, FileNamePattern(**payload))
+            if operation.target == "repository":
+                return _upsert_repository(config, index, RepositoryConfig(**payload), username)
+            return _upsert_user_access(config, index, UserRepositoryAccess(**payload))
+
+        # op == "delete": the payload only names the entry
+        if operation.target == "pattern":
+            return _delete_pattern(config, index, payload["name"])
+        if operation.target == "repository":
+            return _delete_repository(config, index, payload["id"])
+        return _remove_user_access(config, index, payload["username"])
+    except (ValidationError, KeyError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid payload for {operation.op} {operation.target}: {e}"
+        )
+
+
+async def _edit_config(
+    config_service: AdminConfigService,
+    username: str,
+    edit: Callable[[PDMAdminConfig, ConfigIndex], str],
+) -> StandardResponse:
+    """
+    Run `edit` inside a config transaction and turn the outcome into a response.
+
+    Args:
+        config_service: Service owning the configuration
+        username: Admin performing the change (recorded in the commit)
+        edit: Applies the change to the transaction's copy (given with its
+            index), returns a message
+
+    On success every connected client is told over the WebSocket
+    (config_updated) so it can refetch.
+
+    Returns:
+        StandardResponse with edit's message
+
+    Raises:
+        HTTPException: edit's own 400/404, 400 if the result fails
+            validate_config(), 500 if saving fails
+    """
+    try:
+        async with config_service.transaction(username) as config:
+            message = edit(config, ConfigIndex.build(config))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid configuration: {e}"
+        )
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+    await broadcast_config_update(config.last_updated_by, config.last_updated_at)
+    return StandardResponse(status="success", message=message)
 
 
 @router.get("/", response_model=PDMAdminConfig)
+@handle_errors("Error getting admin config", detail_prefix="Failed to load configuration: ")
 async def get_admin_config(
+    request: Request,
     current_user: dict = Depends(get_current_admin_user),
     config_service: AdminConfigService = Depends(get_admin_config_service)
 ):
@@ -43,18 +505,13 @@ async def get_admin_config(
     - User access control
     - Revision settings
     """
-    try:
-        config = config_service.get_config()
-        return config
-    except Exception as e:
-        logger.error(f"Error getting admin config: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to load configuration: {str(e)}"
-        )
+    return _cached_json(
+        request, "config", config_service, config_service.get_config, LONG_POLICY
+    )
 
 
 @router.post("/", response_model=StandardResponse)
+@handle_errors("Error updating admin config", detail_prefix="Failed to update configuration: ")
 async def update_admin_config(
     request: AdminConfigUpdateRequest,
     current_user: dict = Depends(get_current_admin_user),
@@ -64,309 +521,139 @@ async def update_admin_config(
     Update admin configuration (admin only)
 
     Validates and saves configuration to GitLab repository.
-    All users will receive updates via polling.
+    Connected users are notified with a config_updated WebSocket event;
+    other instances pick the change up via their GitLab polling.
     """
-    try:
-        # Validate configuration
-        is_valid, error_msg = config_service.validate_config(request.config)
-        if not is_valid:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid configuration: {error_msg}"
-            )
-
-        # Save configuration
-        success = config_service.save_config(request.config, request.admin_user)
-
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to save configuration"
-            )
-
-        return StandardResponse(
-            status="success",
-            message=f"Configuration updated by {request.admin_user}"
+    # Validate configuration
+    is_valid, error_msg = config_service.validate_config(request.config)
+    if not is_valid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid configuration: {error_msg}"
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating admin config: {e}")
+    # Save configuration. save() waits for any edit transaction in progress,
+    # then writes the file and commits/pushes in a worker thread
+    success = await config_service.save(request.config, request.admin_user)
+
+    if not success:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update configuration: {str(e)}"
+            detail="Failed to save configuration"
         )
 
+    await broadcast_config_update(
+        request.config.last_updated_by, request.config.last_updated_at
+    )
+    return StandardResponse(
+        status="success",
+        message=f"Configuration updated by {request.admin_user}"
+    )
+
 
 @router.get("/patterns", response_model=List[FileNamePattern])
+@handle_errors("Error getting filename patterns")
 async def get_filename_patterns(
+    request: Request,
     current_user: dict = Depends(get_current_admin_user),
     config_service: AdminConfigService = Depends(get_admin_config_service)
 ):
     """Get all filename patterns (admin only)"""
-    try:
-        config = config_service.get_config()
-        return config.filename_patterns
-    except Exception as e:
-        logger.error(f"Error getting filename patterns: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return _cached_json(
+        request, "patterns", config_service,
+        lambda: config_service.get_config().filename_patterns,
+        NORMAL_POLICY
+    )
 
 
 @router.post("/patterns", response_model=StandardResponse)
+@handle_errors("Error adding filename pattern")
 async def add_filename_pattern(
     pattern: FileNamePattern,
     current_user: dict = Depends(get_current_admin_user),
     config_service: AdminConfigService = Depends(get_admin_config_service)
 ):
     """Add a new filename pattern (admin only)"""
-    try:
-        config = config_service.get_config()
-
-        # Check if pattern name already exists
-        if any(p.name == pattern.name for p in config.filename_patterns):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Pattern '{pattern.name}' already exists"
-            )
-
-        # Validate regex patterns
-        import re
-        try:
-            re.compile(pattern.link_pattern)
-            re.compile(pattern.file_pattern)
-        except re.error as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid regex pattern: {e}"
-            )
-
-        # Add pattern
-        config.filename_patterns.append(pattern)
-
-        # Save
-        success = config_service.save_config(config, current_user["username"])
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to save pattern"
-            )
-
-        return StandardResponse(
-            status="success",
-            message=f"Pattern '{pattern.name}' added successfully"
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error adding filename pattern: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await _edit_config(
+        config_service, current_user["username"],
+        lambda config, index: _add_pattern(config, index, pattern)
+    )
 
 
 @router.get("/repositories", response_model=List[RepositoryConfig])
+@handle_errors("Error getting repositories")
 async def get_repositories(
+    request: Request,
     current_user: dict = Depends(get_current_admin_user),
     config_service: AdminConfigService = Depends(get_admin_config_service)
 ):
     """Get all repository configurations (admin only)"""
-    try:
-        config = config_service.get_config()
-        return config.repositories
-    except Exception as e:
-        logger.error(f"Error getting repositories: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return _cached_json(
+        request, "repositories", config_service,
+        lambda: config_service.get_config().repositories,
+        NORMAL_POLICY
+    )
 
 
 @router.post("/repositories", response_model=StandardResponse)
+@handle_errors("Error saving repository")
 async def add_or_update_repository(
     repository: RepositoryConfig,
     current_user: dict = Depends(get_current_admin_user),
     config_service: AdminConfigService = Depends(get_admin_config_service)
 ):
     """Add or update repository configuration (admin only) - acts as upsert"""
-    try:
-        config = config_service.get_config()
-
-        # Validate filename pattern exists
-        if not config_service.get_filename_pattern(repository.filename_pattern_id):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Filename pattern '{repository.filename_pattern_id}' not found"
-            )
-
-        # Check if repository ID already exists
-        existing_index = None
-        for i, r in enumerate(config.repositories):
-            if r.id == repository.id:
-                existing_index = i
-                break
-
-        if existing_index is not None:
-            # Update existing repository
-            config.repositories[existing_index] = repository
-            action = "updated"
-            logger.info(f"Repository '{repository.id}' updated by {current_user['username']}")
-        else:
-            # Add new repository
-            config.repositories.append(repository)
-            action = "added"
-            logger.info(f"Repository '{repository.id}' added by {current_user['username']}")
-
-        # Save
-        success = config_service.save_config(config, current_user["username"])
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to save repository"
-            )
-
-        return StandardResponse(
-            status="success",
-            message=f"Repository '{repository.name}' {action} successfully"
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error saving repository: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await _edit_config(
+        config_service, current_user["username"],
+        lambda config, index: _upsert_repository(config, index, repository, current_user["username"])
+    )
 
 
 @router.get("/user-access", response_model=List[UserRepositoryAccess])
+@handle_errors("Error getting user access")
 async def get_user_access(
+    request: Request,
     current_user: dict = Depends(get_current_admin_user),
     config_service: AdminConfigService = Depends(get_admin_config_service)
 ):
     """Get all user repository access configurations (admin only)"""
-    try:
-        config = config_service.get_config()
-        return config.user_access
-    except Exception as e:
-        logger.error(f"Error getting user access: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return _cached_json(
+        request, "user-access", config_service,
+        lambda: config_service.get_config().user_access,
+        SHORT_POLICY
+    )
 
 
 @router.post("/user-access", response_model=StandardResponse)
+@handle_errors("Error updating user access")
 async def update_user_access(
     user_access: UserRepositoryAccess,
     current_user: dict = Depends(get_current_admin_user),
     config_service: AdminConfigService = Depends(get_admin_config_service)
 ):
     """Add or update user repository access (admin only)"""
-    try:
-        config = config_service.get_config()
-
-        # Validate repository IDs exist
-        repo_ids = {r.id for r in config.repositories}
-        for repo_id in user_access.repository_ids:
-            if repo_id not in repo_ids:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Repository ID '{repo_id}' not found"
-                )
-
-        # Validate default repository
-        if user_access.default_repository_id:
-            if user_access.default_repository_id not in user_access.repository_ids:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Default repository must be in user's access list"
-                )
-
-        # Update or add user access
-        found = False
-        for i, access in enumerate(config.user_access):
-            if access.username == user_access.username:
-                config.user_access[i] = user_access
-                found = True
-                break
-
-        if not found:
-            config.user_access.append(user_access)
-
-        # Save
-        success = config_service.save_config(config, current_user["username"])
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to save user access"
-            )
-
-        return StandardResponse(
-            status="success",
-            message=f"User access updated for '{user_access.username}'"
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating user access: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await _edit_config(
+        config_service, current_user["username"],
+        lambda config, index: _upsert_user_access(config, index, user_access)
+    )
 
 
 @router.delete("/user-access/{username}", response_model=StandardResponse)
+@handle_errors("Error removing user access")
 async def remove_user_access(
     username: str,
     current_user: dict = Depends(get_current_admin_user),
     config_service: AdminConfigService = Depends(get_admin_config_service)
 ):
     """Remove user repository access (admin only)"""
-    try:
-        config = config_service.get_config()
-
-        # Find and remove user access
-        original_len = len(config.user_access)
-        config.user_access = [a for a in config.user_access if a.username != username]
-
-        if len(config.user_access) == original_len:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User access for '{username}' not found"
-            )
-
-        # Save
-        success = config_service.save_config(config, current_user["username"])
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to save configuration"
-            )
-
-        return StandardResponse(
-            status="success",
-            message=f"User access removed for '{username}'"
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error removing user access: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await _edit_config(
+        config_service, current_user["username"],
+        lambda config, index: _remove_user_access(config, index, username)
+    )
 
 
 @router.delete("/patterns/{pattern_name}", response_model=StandardResponse)
+@handle_errors("Error deleting pattern")
 async def delete_pattern(
     pattern_name: str,
     current_user: dict = Depends(get_current_admin_user),
@@ -376,58 +663,14 @@ async def delete_pattern(
 
     NOTE: You cannot delete a pattern if it would leave zero patterns,
     or if any repository is using it. Add a replacement pattern first."""
-    try:
-        config = config_service.get_config()
-
-        # Check if pattern exists
-        if not any(p.name == pattern_name for p in config.filename_patterns):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Pattern '{pattern_name}' not found"
-            )
-
-        # Check if this would leave zero patterns
-        if len(config.filename_patterns) <= 1:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot delete the last pattern. Add a new pattern first."
-            )
-
-        # Check if any repository is using this pattern
-        repos_using = [r.name for r in config.repositories if r.filename_pattern_id == pattern_name]
-        if repos_using:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot delete pattern '{pattern_name}'. Used by repositories: {', '.join(repos_using)}. Change their patterns first."
-            )
-
-        # Remove pattern
-        config.filename_patterns = [p for p in config.filename_patterns if p.name != pattern_name]
-
-        # Save
-        success = config_service.save_config(config, current_user["username"])
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to save configuration"
-            )
-
-        return StandardResponse(
-            status="success",
-            message=f"Pattern '{pattern_name}' deleted successfully"
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting pattern: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await _edit_config(
+        config_service, current_user["username"],
+        lambda config, index: _delete_pattern(config, index, pattern_name)
+    )
 
 
 @router.delete("/repositories/{repo_id}", response_model=StandardResponse)
+@handle_errors("Error deleting repository")
 async def delete_repository(
     repo_id: str,
     current_user: dict = Depends(get_current_admin_user),
@@ -437,71 +680,57 @@ async def delete_repository(
 
     NOTE: You cannot delete a repository if it would leave zero repositories.
     Add a new repository first."""
-    try:
-        config = config_service.get_config()
-
-        # Check if repository exists
-        if not any(r.id == repo_id for r in config.repositories):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Repository '{repo_id}' not found"
-            )
-
-        # CRITICAL: Prevent deleting the main repository
-        if repo_id == "main":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot delete the main repository. It is the default entry point for all users."
-            )
-
-        # Check if this would leave zero repositories
-        if len(config.repositories) <= 1:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot delete the last repository. Add a new repository first."
-            )
+    return await _edit_config(
+        config_service, current_user["username"],
+        lambda config, index: _delete_repository(config, index, repo_id)
+    )
 
-        # Check if any users have this as their default repo
-        users_with_default = [a.username for a in config.user_access if a.default_repository_id == repo_id]
-        if users_with_default:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot delete repository '{repo_id}'. It's the default for users: {', '.join(users_with_default)}. Change their defaults first."
-            )
-
-        # Remove repository
-        config.repositories = [r for r in config.repositories if r.id != repo_id]
-
-        # Remove repo from user access lists
-        for access in config.user_access:
-            if repo_id in access.repository_ids:
-                access.repository_ids.remove(repo_id)
 
-        # Save
-        success = config_service.save_config(config, current_user["username"])
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to save configuration"
-            )
+@router.post("/bulk", response_model=StandardResponse)
+@handle_errors("Error applying bulk config update")
+async def bulk_update_config(
+    request: AdminConfigBulkRequest,
+    current_user: dict = Depends(get_current_admin_user),
+    config_service: AdminConfigService = Depends(get_admin_config_service)
+):
+    """
+    Apply several configuration edits with a single save (admin only)
+
+    Every operation goes through the same checks as its single-item route
+    (POST/DELETE /patterns, /repositories, /user-access). They are applied
+    in order to one copy of the config, which is then validated and saved
+    ONCE - one commit and one push instead of one per edit.
+
+    All or nothing: if any operation is rejected, nothing is saved and the
+    error says which operation failed.
+
+    Example body:
+        {"operations": [
+            {"op": "add", "target": "pattern", "payload": {...FileNamePattern...}},
+            {"op": "add", "target": "repository", "payload": {...RepositoryConfig...}},
+            {"op": "delete", "target": "user_access", "payload": {"username": "bob"}}
+        ]}
+    """
+    username = current_user["username"]
 
-        return StandardResponse(
-            status="success",
-            message=f"Repository '{repo_id}' deleted successfully"
-        )
+    def apply_all(config: PDMAdminConfig, index: ConfigIndex) -> str:
+        for position, operation in enumerate(request.operations):
+            try:
+                _apply_operation(config, index, operation, username)
+            except HTTPException as e:
+                raise HTTPException(
+                    status_code=e.status_code,
+                    detail=f"Operation {position} ({operation.op} {operation.target}): {e.detail}"
+                )
+        return f"Applied {len(request.operations)} configuration change(s)"
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting repository: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await _edit_config(config_service, username, apply_all)
 
 
 @router.get("/my-repositories", response_model=List[str])
+@handle_errors("Error getting user repositories")
 async def get_my_repositories(
+    request: Request,
     current_user: dict = Depends(get_current_admin_user),
     config_service: AdminConfigService = Depends(get_admin_config_service)
 ):
@@ -510,12 +739,9 @@ async def get_my_repositories(
 
     Returns list of repository IDs the user can access
     """
-    try:
-        repo_ids = config_service.get_user_repositories(current_user["username"])
-        return repo_ids
-    except Exception as e:
-        logger.error(f"Error getting user repositories: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    username = current_user["username"]
+    return _cached_json(
+        request, f"my-repositories:{username}", config_service,
+        lambda: config_service.get_user_repositories(username),
+        SHORT_POLICY
+    )
@@ -8,18 +8,25 @@ Endpoints:
 - GET /auth/me - Validate current session
 - POST /auth/request_reset - Request password reset token
 - POST /auth/reset_password - Reset password with token
+- POST /auth/setup_password - DEPRECATED, only registered when the
+  ENABLE_DEPRECATED_AUTH=1 environment variable is set
 
 Authentication methods:
 1. Cookie-based (for web browsers) - httpOnly, secure cookie with JWT
 2. Bearer token (for API clients) - JWT in Authorization header
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status, Form
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Form
+from fastapi.concurrency import run_in_threadpool
 from app.core.security import UserAuth, ADMIN_USERS
 from app.api.dependencies import get_user_auth, get_current_user, get_config_manager
 from app.models import schemas
 from app.models.gitlab_users import get_gitlab_user_registry
 from app.core.config import ConfigManager
+from app.api.responses import FastJSONResponse
+import hashlib
+import json
+import os
 import requests
 import logging
 
@@ -28,12 +35,71 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
     prefix="/auth",
     tags=["Authentication"],
+    default_response_class=FastJSONResponse,
 )
 
 
+# One keep-alive session for all GitLab calls. A bare requests.get opens a
+# new TCP + TLS connection every time; the session keeps connections open
+# and reuses them, so only the first setup pays for the handshake.
+# requests.Session is safe to share across threadpool workers for plain GETs.
+_gitlab_session = requests.Session()
+_gitlab_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_gitlab_session.mount("https://", _gitlab_adapter)
+_gitlab_session.mount("http://", _gitlab_adapter)
+
+
+# Set-Cookie headers for the auth cookie, prebuilt once. All the attributes
+# are fixed; only the token changes, so there's no need to go through
+# Starlette's set_cookie (a SimpleCookie round-trip) on every login.
+#   HttpOnly     - JavaScript cannot access (XSS protection)
+#   Max-Age      - 8 hours (28800 seconds), same as the JWT lifetime
+#   SameSite=Lax - CSRF protection
+#   Secure is NOT set - add "; Secure" in production (HTTPS only)
+# JWTs only use URL-safe base64 characters and dots, so the token can go
+# into the header as-is without cookie quoting.
+_AUTH_COOKIE_TEMPLATE = b"auth_token=%s; HttpOnly; Max-Age=28800; Path=/; SameSite=lax"
+# Logout: empty value, expired in the past, same attributes so the browser
+# matches (and drops) the cookie set above
+_AUTH_COOKIE_CLEAR = (
+    b'auth_token=""; expires=Thu, 01 Jan 1970 00:00:00 GMT; '
+    b"HttpOnly; Max-Age=0; Path=/; SameSite=lax"
+)
+
+
+def _set_auth_cookie(response: Response, access_token: str):
+    """Attach the auth_token cookie to a response."""
+    response.raw_headers.append(
+        (b"set-cookie", _AUTH_COOKIE_TEMPLATE % access_token.encode("ascii")))
+
+
+# User-facing messages for GitLab API errors during setup, by status code
+_GITLAB_ERROR_MESSAGES = {
+    401: "The provided GitLab token is invalid or has expired.",
+    403: "The provided GitLab token does not have the required 'api' scope.",
+}
+
+
+def _fetch_gitlab_user(api_url: str, gitlab_token: str) -> dict:
+    """
+    Ask GitLab who owns a Personal Access Token (blocking).
+
+    `requests` is synchronous, so calling it straight from an async route
+    would freeze the whole event loop - every other request included - for
+    up to the 10 second timeout. Routes call this via run_in_threadpool so
+    the loop keeps serving while we wait on GitLab.
+
+    Raises:
+        requests.exceptions.RequestException: network errors and 4xx/5xx
+    """
+    response_gl = _gitlab_session.get(
+        api_url, headers={"Private-Token": gitlab_token}, timeout=10)
+    response_gl.raise_for_status()  # Raises for 4xx/5xx status codes
+    return response_gl.json()
+
+
 @router.post("/login", response_model=schemas.Token)
 async def login(
-    response: Response,
     username: str = Form(...),
     password: str = Form(...),
     auth_service: UserAuth = Depends(get_user_auth)
@@ -47,8 +113,11 @@ async def login(
     3. Set secure httpOnly cookie
     4. Return token (for API clients) and user info
 
+    The Token body is built by us, so it is returned as a ready response:
+    FastAPI then skips re-validating it against response_model (the model
+    still documents the shape in OpenAPI).
+
     Args:
-        response: FastAPI Response object (for setting cookies)
         username: User's username (from form data)
         password: User's password (from form data)
         auth_service: UserAuth service (injected via dependency)
@@ -60,43 +129,50 @@ async def login(
         401: If username/password is incorrect
     """
     # Verify credentials against local password database
-    # This checks bcrypt hash in .auth/users.json
-    if not auth_service.verify_user(username, password):
-        logger.warning(f"Failed login attempt for user: {username}")
+    # This checks bcrypt hash in .auth/users.json. bcrypt is deliberately
+    # slow (~0.1-0.3s), so it runs in a worker thread - inline, it would
+    # block every other request while one user logs in.
+    if not await run_in_threadpool(auth_service.verify_user, username, password):
+        logger.warning("Failed login attempt for user: %s", username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
         )
 
-    # Create JWT token with username and expiration
-    access_token = auth_service.create_access_token(username)
+    # Lookups ignore case, so continue with the name as it was stored -
+    # "Bob" and "bob" must end up as the same user in locks and history.
+    # The user can be deleted between the check above and this lookup.
+    stored_username = auth_service.canonical_username(username)
+    if stored_username is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+        )
+    username = stored_username
+
+    # Create JWT token with username, admin flag and expiration
+    access_token, is_admin = auth_service.issue_access_token(username)
 
     # Update last_seen for GitLab user
     registry = get_gitlab_user_registry()
     if registry.get_user(username):
         registry.register_user(username)  # Updates last_seen
 
-    logger.info(f"User logged in: {username}")
-
-    # Set secure httpOnly cookie for web browser authentication
-    # This cookie is automatically sent on subsequent requests
-    response.set_cookie(
-        key="auth_token",
-        value=access_token,
-        httponly=True,     # JavaScript cannot access (XSS protection)
-        secure=False,      # MUST be True in production (HTTPS only)
-        samesite="lax",    # CSRF protection
-        max_age=28800      # 8 hours (28800 seconds)
-    )
+    logger.info("User logged in: %s", username)
 
-    # Also return token in response body for API clients
+    # Return token in response body for API clients
     # This supports both browser and API authentication methods
-    return {
+    response = FastJSONResponse({
         "access_token": access_token,
         "token_type": "bearer",
         "username": username,
-        "is_admin": username in ADMIN_USERS
-    }
+        "is_admin": is_admin
+    })
+
+    # Set secure httpOnly cookie for web browser authentication
+    # This cookie is automatically sent on subsequent requests
+    _set_auth_cookie(response, access_token)
+    return response
 
 
 @router.post("/check_password")
@@ -118,17 +194,15 @@ async def check_password(
     Returns:
         {"has_password": bool}
     """
-    # Load users from .auth/users.json and check if username exists
-    users = auth_service._load_users()
-    has_password = username in users
+    # Check .auth/users.json (cached in memory, re-read only when it changes)
+    has_password = auth_service.has_user(username)
 
-    logger.debug(f"Password check for {username}: {has_password}")
+    logger.debug("Password check for %s: %s", username, has_password)
     return {"has_password": has_password}
 
 
 @router.post("/setup-initial-user", response_model=schemas.Token)
 async def setup_initial_user(
-    response: Response,  # CRITICAL: Needed to set cookie
     setup_data: schemas.InitialUserSetup,
     auth_service: UserAuth = Depends(get_user_auth),
     config_manager: ConfigManager = Depends(get_config_manager)
@@ -148,7 +222,6 @@ async def setup_initial_user(
     - Local password is hashed with bcrypt
 
     Args:
-        response: FastAPI Response (for setting auth cookie)
         setup_data: Object containing username, gitlab_token, and new_password
         auth_service: UserAuth service (injected)
         config_manager: ConfigManager service (injected)
@@ -158,56 +231,43 @@ async def setup_initial_user(
 
     Raises:
         500: If GitLab not configured
-        400: If GitLab URL format invalid
         401: If GitLab token invalid or API unreachable
         403: If token doesn't belong to claimed username
     """
-    # Get GitLab base URL from server config
-    gitlab_url = config_manager.config.gitlab.get("base_url")
-    if not gitlab_url:
+    # Get GitLab server root from server config. ConfigManager derives it
+    # from base_url on load/save, e.g.
+    # "https://gitlab.com/mygroup/myproject" → "https://gitlab.com"
+    base_gitlab_url = config_manager.config.gitlab.get("base_url_root")
+    if not base_gitlab_url:
         logger.error("Attempt to setup user, but GitLab URL not configured")
         raise HTTPException(
             status_code=500,
             detail="GitLab URL not configured on server."
         )
 
-    # Extract base domain from potentially full project URL
-    # Example: "https://gitlab.com/mygroup/myproject" → "https://gitlab.com"
-    try:
-        # Split by /, take first 3 parts (https:, , gitlab.com), rejoin
-        base_gitlab_url = "/".join(gitlab_url.rstrip('/').split('/')[:3])
-        logger.debug(f"Extracted base GitLab URL: {base_gitlab_url}")
-    except Exception as e:
-        logger.error(f"Invalid GitLab URL format: {gitlab_url}")
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid GitLab URL format in configuration."
-        )
-
     # Step 1: Verify the GitLab token with GitLab's API
     # Call GitLab's "get current user" endpoint
     api_url = f"{base_gitlab_url}/api/v4/user"
-    headers = {"Private-Token": setup_data.gitlab_token}
 
-    logger.info(f"Verifying GitLab token for user: {setup_data.username}")
+    logger.info("Verifying GitLab token for user: %s", setup_data.username)
 
     try:
-        response_gl = requests.get(api_url, headers=headers, timeout=10)
-        response_gl.raise_for_status()  # Raises for 4xx/5xx status codes
-        gitlab_user = response_gl.json()
+        # Runs in a worker thread so a slow GitLab doesn't stall the server
+        gitlab_user = await run_in_threadpool(
+            _fetch_gitlab_user, api_url, setup_data.gitlab_token)
 
         # Verify the token belongs to the claimed username
         if gitlab_user.get("username") != setup_data.username:
             logger.warning(
-                f"Token mismatch: Token belongs to {gitlab_user.get('username')}, "
-                f"but user claimed to be {setup_data.username}"
+                "Token mismatch: Token belongs to %s, but user claimed to be %s",
+                gitlab_user.get('username'), setup_data.username
             )
             raise HTTPException(
                 status_code=403,
                 detail="GitLab token is valid, but does not belong to the configured user."
             )
 
-        logger.info(f"GitLab token verified for {setup_data.username}")
+        logger.info("GitLab token verified for %s", setup_data.username)
 
         # ===== AUTO-REGISTER GITLAB USER =====
         # Register this user in the GitLab user registry
@@ -221,60 +281,55 @@ async def setup_initial_user(
         )
 
         if is_new_user:
-            logger.info(f"🎉 NEW GitLab user registered: {setup_data.username}")
+            logger.info("🎉 NEW GitLab user registered: %s", setup_data.username)
             # TODO: Create notification for admins about new user
         else:
-            logger.info(f"Existing GitLab user reconnected: {setup_data.username}")
+            logger.info("Existing GitLab user reconnected: %s", setup_data.username)
 
     except requests.exceptions.RequestException as e:
-        # Convert technical errors to user-friendly messages
-        error_detail = str(e)
+        # Convert technical errors to user-friendly messages, keyed on the
+        # HTTP status GitLab answered with (None if it never answered)
+        code = getattr(getattr(e, "response", None), "status_code", None)
+        error_detail = (_GITLAB_ERROR_MESSAGES.get(code)
+                        or f"Could not connect to GitLab: {e}")
 
-        if "401" in error_detail:
-            error_detail = "The provided GitLab token is invalid or has expired."
-        elif "403" in error_detail:
-            error_detail = "The provided GitLab token does not have the required 'api' scope."
-        else:
-            error_detail = f"Could not connect to GitLab: {e}"
-
-        logger.error(f"GitLab API error during setup: {error_detail}")
+        logger.error("GitLab API error during setup: %s", error_detail)
         raise HTTPException(status_code=401, detail=error_detail)
 
     # Step 2: Token is valid, create the local password
     # This hashes the password with bcrypt and saves to .auth/users.json
-    auth_service.create_user_password(
+    # (in a worker thread - bcrypt is slow on purpose)
+    await run_in_threadpool(
+        auth_service.create_user_password,
         setup_data.username,
         setup_data.new_password
     )
-    logger.info(f"Password created for user: {setup_data.username}")
+    logger.info("Password created for user: %s", setup_data.username)
 
     # Step 3: Automatically log the user in
-    access_token = auth_service.create_access_token(setup_data.username)
-
-    # CRITICAL: Set the auth cookie so user stays logged in
-    # This was the missing piece causing the bug!
-    response.set_cookie(
-        key="auth_token",
-        value=access_token,
-        httponly=True,
-        secure=False,  # Must be True in production with HTTPS
-        samesite="lax",
-        max_age=28800  # 8 hours
-    )
+    access_token, is_admin = auth_service.issue_access_token(setup_data.username)
 
-    logger.info(f"User setup complete and logged in: {setup_data.username}")
-
-    # Return token and user info
-    return {
+    # Return token and user info (as a ready response - see login)
+    response = FastJSONResponse({
         "access_token": access_token,
         "token_type": "bearer",
         "username": setup_data.username,
-        "is_admin": setup_data.username in ADMIN_USERS
-    }
+        "is_admin": is_admin
+    })
+
+    # CRITICAL: Set the auth cookie so user stays logged in
+    # This was the missing piece causing the bug!
+    _set_auth_cookie(response, access_token)
+
+    logger.info("User setup complete and logged in: %s", setup_data.username)
+    return response
 
 
 @router.get("/me", response_model=schemas.Token)
-async def get_current_session_user(current_user: dict = Depends(get_current_user)):
+async def get_current_session_user(
+    request: Request,
+    current_user: dict = Depends(get_current_user)
+):
     """
     Validate current session and return user info.
 
@@ -288,23 +343,42 @@ async def get_current_session_user(current_user: dict = Depends(get_current_user
     4. If valid, returns user info
     5. If invalid, dependency raises 401
 
+    The answer only depends on the token's claims, so it carries an ETag
+    built from them. A browser revalidating with If-None-Match gets an empty
+    304 while the same session is active. The token itself is still checked
+    on every call - only the response body is skipped.
+
     Args:
+        request: FastAPI Request (for If-None-Match)
         current_user: User payload from JWT (injected by dependency)
 
     Returns:
-        Token object with user info
+        Token object with user info, or 304 if the client's copy is current
 
     Raises:
         401: If no cookie or invalid/expired token (raised by dependency)
     """
     # The get_current_user dependency does all the validation work
     # If we get here, the user is authenticated
-    return {
+    username = current_user.get("sub")
+    is_admin = current_user.get("is_admin", False)
+
+    # exp is part of the tag so a fresh login never matches an old copy
+    claims = f"{username}|{is_admin}|{current_user.get('exp')}".encode("utf-8")
+    etag = '"' + hashlib.blake2b(claims, digest_size=8).hexdigest() + '"'
+
+    # no-cache: the browser must still ask each time - after a logout it
+    # has to see the 401, not a stored "logged in" answer
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return FastJSONResponse({
         "access_token": "from_cookie",  # Not resent for security
         "token_type": "bearer",
-        "username": current_user.get("sub"),
-        "is_admin": current_user.get("is_admin", False)
-    }
+        "username": username,
+        "is_admin": is_admin
+    }, headers=headers)
 
 
 @router.post("/validate")
@@ -321,37 +395,34 @@ async def validate_token(current_user: dict = Depends(get_current_user)):
     Returns:
         {"valid": true, "user": {...}}
     """
-    return {"valid": True, "user": current_user}
+    return FastJSONResponse({"valid": True, "user": current_user})
+
+
+# The logout reply never changes, so it is encoded once at import time
+_LOGOUT_BODY = json.dumps(
+    {"status": "success", "message": "Logged out successfully"}).encode("utf-8")
 
 
 @router.post("/logout")
-async def logout(response: Response):
+async def logout():
     """
     Logout endpoint - clears the authentication cookie.
 
     This invalidates the session by removing the auth_token cookie
     from the browser.
 
-    Args:
-        response: FastAPI Response object (for clearing cookies)
-
     Returns:
         {"status": "success", "message": "Logged out successfully"}
     """
+    # A fresh Response per call (the cookie header differs per response),
+    # but the body is the prebuilt bytes - no JSON encoding on this path
+    response = Response(content=_LOGOUT_BODY, media_type="application/json")
+
     # Clear the auth cookie by setting it to expire immediately
-    response.delete_cookie(
-        key="auth_token",
-        httponly=True,
-        secure=False,  # Must match the cookie creation settings
-        samesite="lax"
-    )
+    response.raw_headers.append((b"set-cookie", _AUTH_COOKIE_CLEAR))
 
     logger.info("User logged out successfully")
-
-    return {
-        "status": "success",
-        "message": "Logged out successfully"
-    }
+    return response
 
 
 @router.post("/request_reset")
@@ -377,13 +448,13 @@ async def request_password_reset(
     """
     try:
         reset_token = auth_service.reset_password_request(username)
-        logger.info(f"Password reset requested for: {username}")
+        logger.info("Password reset requested for: %s", username)
 
         # TODO: In production, email this token instead of returning it
         return {"status": "success", "reset_token": reset_token}
 
     except ValueError as e:
-        logger.warning(f"Reset request failed for {username}: {e}")
+        logger.warning("Reset request failed for %s: %s", username, e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
@@ -412,16 +483,18 @@ async def reset_password(
     Raises:
         400: If token is invalid or expired
     """
-    success = auth_service.reset_password(username, reset_token, new_password)
+    # Hashes the new password with bcrypt, so keep it off the event loop
+    success = await run_in_threadpool(
+        auth_service.reset_password, username, reset_token, new_password)
 
     if success:
-        logger.info(f"Password reset successful for: {username}")
+        logger.info("Password reset successful for: %s", username)
         return {
             "status": "success",
             "message": "Password has been reset successfully."
         }
     else:
-        logger.warning(f"Password reset failed for {username}: Invalid token")
+        logger.warning("Password reset failed for %s: Invalid token", username)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid or expired reset token."
@@ -429,8 +502,12 @@ async def reset_password(
 
 
 # Deprecated endpoint - should be removed or protected
-# Currently allows anyone to create a password for any username (security risk)
-@router.post("/setup_password")
+# Allows anyone to create a password for any username (security risk), so it
+# is only put on the router when explicitly switched on - see the bottom of
+# this file.
+ENABLE_DEPRECATED_AUTH = os.getenv("ENABLE_DEPRECATED_AUTH") == "1"
+
+
 async def setup_password(
     username: str = Form(...),
     password: str = Form(...),
@@ -442,14 +519,17 @@ async def setup_password(
     Security issue: Anyone can create a password for any username.
     Use /setup-initial-user instead which verifies GitLab identity.
 
+    Only registered when ENABLE_DEPRECATED_AUTH=1; otherwise the route
+    doesn't exist and requests get a plain 404.
+
     TODO: Remove this endpoint or add proper protection.
     """
     logger.warning(
-        f"DEPRECATED endpoint /setup_password used for {username}. "
-        "This endpoint should be removed!"
+        "DEPRECATED endpoint /setup_password used for %s. "
+        "This endpoint should be removed!", username
     )
 
-    if auth_service.create_user_password(username, password):
+    if await run_in_threadpool(auth_service.create_user_password, username, password):
         token = auth_service.create_access_token(username)
         return {
             "status": "success",
@@ -461,3 +541,10 @@ async def setup_password(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create password for user."
         )
+
+
+if ENABLE_DEPRECATED_AUTH:
+    logger.warning(
+        "ENABLE_DEPRECATED_AUTH=1: unverified POST /auth/setup_password is "
+        "enabled. Do not run like this in production!")
+    router.add_api_route("/setup_password", setup_password, methods=["POST"])
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from app.models import schemas
 from app.api.dependencies import get_config_manager
 from app.core.config import ConfigManager
+from app.core.security import ADMIN_USERS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,23 +17,33 @@ router = APIRouter(
 async def get_config_summary(
     config_manager: ConfigManager = Depends(get_config_manager)
 ):
-    """Retrieves a summary of the current application configuration."""
-    # This logic was originally in the ConfigManager class, but it's better here
-    # as it constructs a summary specifically for an API response.
-    cfg = config_manager.config
-    gitlab_cfg = cfg.gitlab
-    local_cfg = cfg.local
+    """
+    Retrieves a summary of the current application configuration.
+
+    The serialized summary is kept on the ConfigManager until the next
+    save_config(), so repeat calls skip building and validating the model.
+    """
+    body = config_manager.summary_json
+    if body is None:
+        # This logic was originally in the ConfigManager class, but it's better here
+        # as it constructs a summary specifically for an API response.
+        cfg = config_manager.config
+        gitlab_cfg = cfg.gitlab
+        local_cfg = cfg.local
+
+        summary = schemas.ConfigSummary(
+            gitlab_url=gitlab_cfg.get('base_url'),
+            project_id=gitlab_cfg.get('project_id'),
+            username=gitlab_cfg.get('username'),
+            has_token=bool(gitlab_cfg.get('token')),
+            repo_path=local_cfg.get('repo_path'),
+            # TODO: The 'is_admin' status will be determined by the user's token, not the config file.
+            # We will adjust this when we refactor the user management.
+            is_admin=gitlab_cfg.get('username') in ADMIN_USERS
+        )
+        body = config_manager.summary_json = summary.model_dump_json().encode("utf-8")
 
-    return schemas.ConfigSummary(
-        gitlab_url=gitlab_cfg.get('base_url'),
-        project_id=gitlab_cfg.get('project_id'),
-        username=gitlab_cfg.get('username'),
-        has_token=bool(gitlab_cfg.get('token')),
-        repo_path=local_cfg.get('repo_path'),
-        # TODO: The 'is_admin' status will be determined by the user's token, not the config file.
-        # We will adjust this when we refactor the user management.
-        is_admin=gitlab_cfg.get('username') in ["admin", "g4m3rm1k3"]
-    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/gitlab", response_model=schemas.StandardResponse)
@@ -1,14 +1,57 @@
 # backend/app/api/routers/dashboard.py
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
 from app.models import schemas
 from app.api.dependencies import get_lock_manager, get_current_user, get_git_repo
 from app.services.lock_service import MetadataManager
 from app.services.git_service import GitRepository
 import json
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# First token in a commit message that looks like one of our file names, e.g.
+# the "1234567-A1.mcam" in "CHECKOUT: 1234567-A1.mcam by bob - edit". Compiled
+# once here so the feed loop is a single C-level scan per message.
+_FILENAME_RE = re.compile(r"\S+\.(?:mcam|vnc|emcam|link)\b", re.IGNORECASE)
+# Punctuation around the name ("LINK: Create 'x.link' -> ...") that isn't part of it
+_FILENAME_STRIP = "'\":,.-"
+# Cheap pre-check for the regex: a message that contains none of these (most
+# "REV x.y: ..." and admin commits) can't match it, and a few plain substring
+# searches are much cheaper than a regex scan that fails
+_FILE_EXTENSIONS = ('.mcam', '.vnc', '.emcam', '.link')
+
+# Commit message marker -> activity event type, checked in order; the first hit
+# wins. Upper-case markers are matched as written (they're the prefixes our own
+# commit messages use), lower-case ones against the lower-cased message so a
+# free-text "Checkin" still counts. UNLOCK has to come before LOCK, which it
+# contains.
+_EVENT_MARKERS = (
+    ('CHECK-IN', 'checkin'),
+    ('checkin', 'checkin'),
+    ('UNLOCK', 'cancel_checkout'),
+    ('CHECK-OUT', 'checkout'),
+    ('checkout', 'checkout'),
+    ('LOCK', 'checkout'),
+    ('cancel', 'cancel_checkout'),
+    ('DELETE', 'delete'),
+)
+
+
+def _classify_event(message: str, msg_lower: str) -> str:
+    """
+    Map a commit message to an activity event type ('commit' if unknown).
+
+    `msg_lower` is message.lower(), passed in because the feed loop needs it
+    for the filename check as well.
+    """
+    for marker, event_type in _EVENT_MARKERS:
+        if marker in (msg_lower if marker.islower() else message):
+            return event_type
+    return 'commit'
+
+
 router = APIRouter(
     prefix="/dashboard",
     tags=["Dashboard"],
@@ -40,7 +83,9 @@ async def get_dashboard_stats(
 @router.get("/activity", response_model=schemas.ActivityFeed)
 async def get_activity_feed(
     limit: int = Query(50, ge=1, le=200, description="Maximum number of activities to return"),
-    offset: int = Query(0, ge=0, description="Number of activities to skip"),
+    after: Optional[str] = Query(
+        None, pattern=r"^[0-9a-fA-F]{7,40}$",
+        description="Cursor: commit hash of the last activity on the previous page (its next_cursor)"),
     git_repo: GitRepository = Depends(get_git_repo)
 ):
     """
@@ -48,40 +93,41 @@ async def get_activity_feed(
 
     This endpoint returns a feed of recent commits, which shows what users
     have been checking in files, canceling checkouts, etc.
+
+    Pages are linked by cursor rather than offset: each response carries
+    `next_cursor`, and passing it back as `after` continues from there.
+
+    Raises:
+        400: If `after` isn't a commit in the repository's history
     """
     if not git_repo:
         return schemas.ActivityFeed(activities=[])
 
-    try:
-        # Get commit history from Git
-        # The git_repo should have a method to get commits
-        commits = git_repo.get_recent_commits(limit=limit + offset)
+    # A bad cursor would otherwise come back as an empty page, which looks
+    # exactly like "no more activity"
+    if after and not git_repo.is_history_commit(after):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown activity cursor: {after}")
 
-        # Skip the offset commits
-        commits = commits[offset:offset + limit]
+    try:
+        # Get commit history from Git, starting below the cursor if given
+        commits = git_repo.get_recent_commits(limit=limit, after_hash=after)
 
         activities = []
         for commit in commits:
             # Parse commit message to determine event type
             message = commit.get('message', '')
-            event_type = 'commit'
-
-            if 'CHECK-IN' in message or 'checkin' in message.lower():
-                event_type = 'checkin'
-            elif 'CHECK-OUT' in message or 'checkout' in message.lower() or 'LOCK' in message:
-                event_type = 'checkout'
-            elif 'UNLOCK' in message or 'cancel' in message.lower():
-                event_type = 'cancel_checkout'
-            elif 'DELETE' in message:
-                event_type = 'delete'
+            msg_lower = message.lower()
+            event_type = _classify_event(message, msg_lower)
 
             # Extract filename from message if possible
             # Format is usually like "CHECK-IN: filename.mcam - message"
             filename = "unknown"
-            for part in message.split():
-                if any(ext in part.lower() for ext in ['.mcam', '.vnc', '.emcam', '.link']):
-                    filename = part.strip(':,.-')
-                    break
+            if any(ext in msg_lower for ext in _FILE_EXTENSIONS):
+                match = _FILENAME_RE.search(message)
+                if match:
+                    filename = match.group(0).strip(_FILENAME_STRIP)
 
             # Try to get revision from metadata in commit if available
             revision = None
@@ -97,7 +143,9 @@ async def get_activity_feed(
                 revision=revision
             ))
 
-        return schemas.ActivityFeed(activities=activities)
+        # A short page means we've hit the start of history
+        next_cursor = activities[-1].commit_hash if len(activities) == limit else None
+        return schemas.ActivityFeed(activities=activities, next_cursor=next_cursor)
 
     except Exception as e:
         logger.error(f"Failed to retrieve activity feed: {e}", exc_info=True)
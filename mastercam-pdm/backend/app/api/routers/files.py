@@ -1,17 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Form, UploadFile, File, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
+from collections import defaultdict
 from typing import Dict, List, Optional
+import asyncio
 import os
 import logging
 import json
 
 # Import our schemas, dependencies, and services
 from app.models import schemas
-from app.api.dependencies import get_git_repo, get_lock_manager, get_current_user
+from app.api.dependencies import get_git_repo, RequestContextDep
+from app.api.responses import FastJSONResponse
 from app.services.git_service import GitRepository
-from app.services.lock_service import MetadataManager
 
 logger = logging.getLogger(__name__)
 
+# The routes are async, so GitRepository calls that run git (commits and
+# pushes, walking the tree, reading history) go through run_in_threadpool.
+# Called directly they would block the event loop, and every other request
+# with it, for as long as git takes.
 router = APIRouter(
     prefix="/files",
     tags=["File Management"],
@@ -22,21 +30,28 @@ router = APIRouter(
 
 @router.get("", response_model=Dict[str, List[schemas.FileInfo]])
 async def get_all_files(
-    git_repo: GitRepository = Depends(get_git_repo),
-    lock_manager: MetadataManager = Depends(get_lock_manager),
-    current_user: dict = Depends(get_current_user)
+    ctx: RequestContextDep
 ):
     """
     Retrieves a structured list of all files, including processing for .link files
     to create virtual file entries.
     """
-    if not git_repo or not lock_manager:
+    if not ctx.git or not ctx.locks:
         raise HTTPException(
             status_code=503, detail="Repository not initialized.")
 
     try:
-        all_files_from_git = git_repo.list_files()
-        all_locks = {lock['file']                     : lock for lock in lock_manager.get_all_locks()}
+        # The three reads are independent (git ls-files plus a stat per file,
+        # the parsed .meta.json/.link files, and the .locks directory), so run
+        # them side by side in the threadpool rather than one after another.
+        # `sidecars` and `all_locks` are already parsed and keyed by path (and
+        # cached until they change), so the loops below only do dictionary
+        # lookups into them.
+        all_files_from_git, sidecars, all_locks = await asyncio.gather(
+            run_in_threadpool(ctx.git.list_files),
+            run_in_threadpool(ctx.git.get_meta_snapshot),
+            run_in_threadpool(ctx.locks.get_locks_by_path),
+        )
 
         physical_files = [
             f for f in all_files_from_git if not f['path'].endswith('.link')]
@@ -51,12 +66,10 @@ async def get_all_files(
         # Process .link files to create virtual file entries
         for link_file in link_files:
             try:
-                link_content_bytes = git_repo.get_file_content(
-                    link_file['path'])
-                if not link_content_bytes:
+                link_content = sidecars.get(link_file['path'])
+                if not link_content:
                     continue
 
-                link_content = json.loads(link_content_bytes)
                 master_filename = link_content.get("master_file")
 
                 if master_filename and master_filename in master_file_map:
@@ -76,8 +89,8 @@ async def get_all_files(
                     f"Could not process link file {link_file['filename']}: {e}")
 
         # Now, process the combined list to add metadata and lock info
-        grouped_files = {}
-        username = current_user.get('sub')
+        grouped_files = defaultdict(list)
+        username = ctx.user.get('sub')
 
         for file_data in all_files_to_process:
             path_for_meta = file_data['path']
@@ -85,50 +98,65 @@ async def get_all_files(
             # Enrich with lock status
             lock_info = all_locks.get(path_for_meta)
             if lock_info:
-                file_data['status'] = "checked_out_by_user" if lock_info.get(
+                file_status = "checked_out_by_user" if lock_info.get(
                     'user') == username else "locked"
-                file_data['locked_by'] = lock_info.get('user')
-                file_data['locked_at'] = lock_info.get('timestamp')
-                file_data['checkout_message'] = lock_info.get('message', '')
+                locked_by = lock_info.get('user')
+                locked_at = lock_info.get('timestamp')
+                checkout_message = lock_info.get('message', '')
             else:
-                file_data['status'] = "unlocked"
-                file_data['checkout_message'] = ''
+                file_status = "unlocked"
+                locked_by = locked_at = None
+                checkout_message = ''
 
             # Enrich with metadata from .meta.json files
-            meta_content_bytes = git_repo.get_file_content(
-                f"{path_for_meta}.meta.json")
-            if meta_content_bytes:
-                try:
-                    meta_content = json.loads(meta_content_bytes)
-                    file_data['description'] = meta_content.get('description')
-                    file_data['revision'] = meta_content.get('revision')
-                except json.JSONDecodeError:
-                    logger.warning(
-                        f"Could not parse metadata for {path_for_meta}")
+            # (unparseable files are None and were logged when read)
+            meta_content = sidecars.get(f"{path_for_meta}.meta.json")
+            if isinstance(meta_content, dict):
+                description = meta_content.get('description')
+                revision = meta_content.get('revision')
+            else:
+                description = revision = None
 
             # Hierarchical grouping: first 2 digits (main group), then 7 digits (subgroup)
             filename = file_data['filename']
 
-            # Add group and subgroup metadata to file for frontend rendering
-            if len(filename) >= 2 and filename[:2].isdigit():
-                file_data['group'] = f"{filename[:2]}XXXXX"
+            # Add group and subgroup metadata to file for frontend rendering.
+            # (A 7-digit prefix implies a 2-digit one, so check the longer one
+            # only when the shorter matched.)
+            prefix = filename[:2]
+            if len(prefix) == 2 and prefix.isdigit():
+                group_name = f"{prefix}XXXXX"
                 # If has 7 digits, also add subgroup
-                if len(filename) >= 7 and filename[:7].isdigit():
-                    file_data['subgroup'] = filename[:7]
-                else:
-                    file_data['subgroup'] = None
+                number = filename[:7]
+                subgroup = number if len(number) == 7 and number.isdigit() else None
             else:
-                file_data['group'] = "Miscellaneous"
-                file_data['subgroup'] = None
-
-            # Group by the main group (first 2 digits) for return structure
-            group_name = file_data['group']
-            if group_name not in grouped_files:
-                grouped_files[group_name] = []
-
-            grouped_files[group_name].append(file_data)
-
-        return grouped_files
+                group_name = "Miscellaneous"
+                subgroup = None
+
+            # Group by the main group (first 2 digits) for return structure.
+            # The entry has exactly the FileInfo fields, in the same order, so
+            # the JSON is what response_model validation used to produce.
+            grouped_files[group_name].append({
+                'filename': filename,
+                'path': path_for_meta,
+                'status': file_status,
+                'locked_by': locked_by,
+                'locked_at': locked_at,
+                'checkout_message': checkout_message,
+                'size': file_data['size'],
+                'modified_at': file_data['modified_at'],
+                'description': description,
+                'revision': revision,
+                'is_link': file_data.get('is_link', False),
+                'master_file': file_data.get('master_file'),
+                'group': group_name,
+                'subgroup': subgroup
+            })
+
+        # Returned as a response object, so FastAPI skips validating every
+        # FileInfo against response_model (kept for the API docs) and the
+        # jsonable_encoder pass - the dicts above are built to match it
+        return FastJSONResponse(dict(grouped_files))
 
     except Exception as e:
         logger.error(f"Failed to retrieve file list: {e}", exc_info=True)
@@ -139,49 +167,53 @@ async def get_all_files(
 @router.post("/{filename}/checkout")
 async def checkout_file(
     filename: str,
-    request: schemas.CheckoutRequest,
-    git_repo: GitRepository = Depends(get_git_repo),
-    lock_manager: MetadataManager = Depends(get_lock_manager),
-    current_user: dict = Depends(get_current_user)
+    ctx: RequestContextDep,
+    request: schemas.CheckoutRequest
 ):
     """Locks a file for a user with a message explaining why, preventing others from editing it."""
-    if request.user != current_user.get('sub'):
+    if request.user != ctx.user.get('sub'):
         raise HTTPException(status_code=403, detail="User mismatch")
 
-    file_path = git_repo.find_file_path(filename)
+    file_path = await run_in_threadpool(ctx.git.find_file_path, filename)
     if not file_path:
         raise HTTPException(status_code=404, detail="File not found")
 
-    # Check if already locked
-    existing_lock = lock_manager.get_lock_info(file_path)
-    if existing_lock:
-        raise HTTPException(
-            status_code=409,
-            detail=f"File is already checked out by {existing_lock['user']}"
-        )
+    def lock_and_commit():
+        # Check, create and commit the lock under the repository lock, so no
+        # check-in or cancel on this file can release or commit its lock file
+        # in between (and pick up ours by mistake)
+        with ctx.git._repo_lock:
+            existing_lock = ctx.locks.get_lock_info(file_path)
+            if existing_lock:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"File is already checked out by {existing_lock['user']}"
+                )
 
-    # Create lock with message
-    lock_file_path = lock_manager.create_lock(
-        file_path=file_path,
-        user=request.user,
-        message=request.message or ""
-    )
+            # Create lock with message
+            lock_file_path = ctx.locks.create_lock(
+                file_path=file_path,
+                user=request.user,
+                message=request.message or ""
+            )
 
-    if not lock_file_path:
-        raise HTTPException(status_code=500, detail="Failed to create lock")
+            if not lock_file_path:
+                raise HTTPException(status_code=500, detail="Failed to create lock")
 
-    # Commit the lock to Git
-    relative_lock_path = str(lock_file_path.relative_to(git_repo.repo_path))
-    success = git_repo.commit_and_push(
-        file_paths=[relative_lock_path],
-        message=f"CHECKOUT: {filename} by {request.user} - {request.message[:50] if request.message else 'No reason provided'}",
-        author_name=request.user
-    )
+            # Commit the lock to Git
+            relative_lock_path = str(lock_file_path.relative_to(ctx.git.repo_path))
+            success = ctx.git.commit_and_push(
+                file_paths=[relative_lock_path],
+                message=f"CHECKOUT: {filename} by {request.user} - {request.message[:50] if request.message else 'No reason provided'}",
+                author_name=request.user
+            )
+
+            if not success:
+                # Rollback lock if push fails
+                ctx.locks.release_lock(file_path)
+                raise HTTPException(status_code=500, detail="Failed to sync checkout")
 
-    if not success:
-        # Rollback lock if push fails
-        lock_manager.release_lock(file_path)
-        raise HTTPException(status_code=500, detail="Failed to sync checkout")
+    await run_in_threadpool(lock_and_commit)
 
     logger.info(f"File {filename} checked out by {request.user}")
     return {"status": "success", "message": f"File {filename} is now checked out"}
@@ -192,106 +224,117 @@ async def checkout_file(
 @router.post("/{filename}/checkin")
 async def checkin_file(
     filename: str,
+    ctx: RequestContextDep,
     user: str = Form(...),
     commit_message: str = Form(...),
     rev_type: str = Form(...),
     new_major_rev: Optional[str] = Form(None),
-    file: UploadFile = File(...),
-    git_repo: GitRepository = Depends(get_git_repo),
-    lock_manager: MetadataManager = Depends(get_lock_manager),
-    current_user: dict = Depends(get_current_user)
+    file: UploadFile = File(...)
 ):
     """Uploads a modified file, updates its metadata, and releases the lock."""
-    if user != current_user.get('sub'):
+    if user != ctx.user.get('sub'):
         raise HTTPException(
             status_code=403, detail="Authenticated user does not match user in form.")
 
-    file_path = git_repo.find_file_path(filename)
+    file_path = await run_in_threadpool(ctx.git.find_file_path, filename)
     if not file_path:
         raise HTTPException(
             status_code=404, detail="File to check in not found.")
 
-    lock_info = lock_manager.get_lock_info(file_path)
-    if not lock_info or lock_info['user'] != user:
-        raise HTTPException(
-            status_code=403, detail="You do not have this file locked.")
+    def release_and_checkin():
+        # Everything from checking the lock to restoring it on failure runs
+        # under the repository lock. Otherwise a checkout could create a new
+        # lock in the gap after ours is deleted, and this commit would push
+        # it (or the restore below would overwrite it).
+        with ctx.git._repo_lock:
+            lock_info = ctx.locks.get_lock_info(file_path)
+            if not lock_info or lock_info['user'] != user:
+                raise HTTPException(
+                    status_code=403, detail="You do not have this file locked.")
 
-    try:
-        # This operation is now a high-level orchestration of service methods
-        success = git_repo.checkin_file(
-            file_path=file_path,
-            file_content=await file.read(),
-            commit_message=commit_message,
-            rev_type=rev_type,
-            new_major_rev=new_major_rev,
-            author_name=user
-        )
+            # Delete the lock file up front so its removal rides along in the
+            # check-in commit - one push instead of a second "UNLOCK" round trip.
+            lock_rel_path = str(ctx.locks._get_lock_file_path(
+                file_path).relative_to(ctx.git.repo_path))
+            ctx.locks.release_lock(file_path)
 
-        if not success:
-            raise HTTPException(
-                status_code=500, detail="Failed to commit and push changes.")
-
-        # Release the lock after a successful push
-        lock_manager.release_lock(file_path)
-        git_repo.commit_and_push(
-            file_paths=[str(lock_manager._get_lock_file_path(
-                file_path).relative_to(git_repo.repo_path))],
-            message=f"UNLOCK: {filename} after check-in by {user}",
-            author_name=user
-        )
+            try:
+                # This operation is now a high-level orchestration of service methods
+                success = ctx.git.checkin_file(
+                    file_path=file_path,
+                    source=file.file,
+                    commit_message=commit_message,
+                    rev_type=rev_type,
+                    new_major_rev=new_major_rev,
+                    author_name=user,
+                    extra_paths=[lock_rel_path]
+                )
+            except Exception as e:
+                logger.error(f"Check-in failed for {filename}: {e}", exc_info=True)
+                success = False
+                error_detail = f"An internal error occurred during check-in: {e}"
+            else:
+                error_detail = "Failed to commit and push changes."
 
-        return {"status": "success"}
+            if not success:
+                # The lock deletion never reached the remote, so put the lock
+                # back. We can't rely on the reset to origin for this: it never
+                # runs if GitLab is down. Not forced - if the reset already
+                # restored the lock file, it is left as it is.
+                ctx.locks.create_lock(
+                    file_path, user, lock_info.get('message', ''))
+                raise HTTPException(status_code=500, detail=error_detail)
 
-    except Exception as e:
-        logger.error(f"Check-in failed for {filename}: {e}", exc_info=True)
-        # We don't re-lock here, because the push might have partially succeeded,
-        # leaving the repo in a state that requires manual intervention.
-        raise HTTPException(
-            status_code=500, detail=f"An internal error occurred during check-in: {e}")
+    await run_in_threadpool(release_and_checkin)
+    return {"status": "success"}
 
 
 @router.post("/{filename}/cancel_checkout")
 async def cancel_checkout(
     filename: str,
-    request: schemas.CheckoutRequest,
-    git_repo: GitRepository = Depends(get_git_repo),
-    lock_manager: MetadataManager = Depends(get_lock_manager),
-    current_user: dict = Depends(get_current_user)
+    ctx: RequestContextDep,
+    request: schemas.CheckoutRequest
 ):
     """Releases a user's lock on a file without saving any changes."""
-    if request.user != current_user.get('sub'):
+    if request.user != ctx.user.get('sub'):
         raise HTTPException(status_code=403, detail="User mismatch.")
 
-    file_path = git_repo.find_file_path(filename)
+    file_path = await run_in_threadpool(ctx.git.find_file_path, filename)
     if not file_path:
         raise HTTPException(status_code=404, detail="File not found.")
 
-    lock_info = lock_manager.get_lock_info(file_path)
-    if not lock_info or lock_info['user'] != request.user:
-        raise HTTPException(
-            status_code=403, detail="You do not have this file checked out.")
+    def release_and_commit():
+        # Same as check-in: release and commit under the repository lock so
+        # a checkout can't slip its lock file into this commit
+        with ctx.git._repo_lock:
+            lock_info = ctx.locks.get_lock_info(file_path)
+            if not lock_info or lock_info['user'] != request.user:
+                raise HTTPException(
+                    status_code=403, detail="You do not have this file checked out.")
 
-    # Get the lock file path before releasing the lock
-    lock_file_path = lock_manager._get_lock_file_path(file_path)
-    relative_lock_path = str(lock_file_path.relative_to(git_repo.repo_path))
+            # Get the lock file path before releasing the lock
+            lock_file_path = ctx.locks._get_lock_file_path(file_path)
+            relative_lock_path = str(lock_file_path.relative_to(ctx.git.repo_path))
 
-    # Release the lock locally first
-    lock_manager.release_lock(file_path)
+            # Release the lock locally first
+            ctx.locks.release_lock(file_path)
 
-    # Revert any local changes and clean up downloaded LFS file
-    git_repo.revert_local_file_changes(file_path)
+            # Revert any local changes and clean up downloaded LFS file
+            ctx.git.revert_local_file_changes(file_path)
 
-    # Commit the lock release
-    success = git_repo.commit_and_push(
-        file_paths=[relative_lock_path],
-        message=f"USER CANCEL: Unlock {filename} by {request.user}",
-        author_name=request.user
-    )
+            # Commit the lock release
+            success = ctx.git.commit_and_push(
+                file_paths=[relative_lock_path],
+                message=f"USER CANCEL: Unlock {filename} by {request.user}",
+                author_name=request.user
+            )
 
-    if not success:
-        # If push fails, we can't guarantee state. The safest is to ask the user to try again.
-        raise HTTPException(
-            status_code=500, detail="Failed to sync checkout cancellation. Please try again.")
+            if not success:
+                # If push fails, we can't guarantee state. The safest is to ask the user to try again.
+                raise HTTPException(
+                    status_code=500, detail="Failed to sync checkout cancellation. Please try again.")
+
+    await run_in_threadpool(release_and_commit)
 
     return {"status": "success", "message": "Checkout cancelled."}
 
@@ -302,25 +345,24 @@ async def download_file(
     git_repo: GitRepository = Depends(get_git_repo)
 ):
     """Downloads the latest version of a file."""
-    file_path = git_repo.find_file_path(filename)
+    file_path = await run_in_threadpool(git_repo.find_file_path, filename)
     if not file_path:
         raise HTTPException(status_code=404, detail="File not found.")
 
-    # Download LFS content if it's just a pointer
-    if git_repo.is_lfs_pointer(file_path):
-        if not git_repo.download_lfs_file(file_path):
-            raise HTTPException(
-                status_code=500, detail="Failed to download file content from LFS.")
-
-    content = git_repo.get_file_content(file_path)
-    if content is None:
+    # Checks the file once, downloading LFS content if it's just a pointer
+    full_path, reason = await run_in_threadpool(git_repo.get_download_path, file_path)
+    if reason == "lfs":
+        raise HTTPException(
+            status_code=500, detail="Failed to download file content from LFS.")
+    if full_path is None:
         raise HTTPException(
             status_code=404, detail="File content could not be read.")
 
-    return Response(
-        content,
+    # Stream straight from disk instead of reading the whole file into memory
+    return FileResponse(
+        full_path,
         media_type='application/octet-stream',
-        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+        filename=filename
     )
 
 
@@ -330,11 +372,11 @@ async def get_file_history(
     git_repo: GitRepository = Depends(get_git_repo)
 ):
     """Retrieves the version history of a file."""
-    file_path = git_repo.find_file_path(filename)
+    file_path = await run_in_threadpool(git_repo.find_file_path, filename)
     if not file_path:
         raise HTTPException(status_code=404, detail="File not found.")
 
-    history = git_repo.get_file_history(file_path)
+    history = await run_in_threadpool(git_repo.get_file_history, file_path)
     return {"filename": filename, "history": history}
 
 
@@ -357,11 +399,12 @@ async def get_file_history_revisions(
     Returns:
         File history with revision range, total count, and list of revisions
     """
-    file_path = git_repo.find_file_path(filename)
+    file_path = await run_in_threadpool(git_repo.find_file_path, filename)
     if not file_path:
         raise HTTPException(status_code=404, detail="File not found.")
 
-    history_data = git_repo.get_file_history_with_revisions(
+    history_data = await run_in_threadpool(
+        git_repo.get_file_history_with_revisions,
         file_path,
         start_revision=start_revision,
         end_revision=end_revision,
@@ -378,33 +421,36 @@ async def download_file_version(
     commit_hash: str,
     git_repo: GitRepository = Depends(get_git_repo)
 ):
-    file_path = git_repo.find_file_path(filename)
+    file_path = await run_in_threadpool(git_repo.find_file_path, filename)
     if not file_path:
         raise HTTPException(
             status_code=404, detail="File not found in current version.")
 
-    content = git_repo.get_file_content_at_commit(file_path, commit_hash)
-    if content is None:
+    stream = await run_in_threadpool(
+        git_repo.open_file_stream_at_commit, file_path, commit_hash)
+    if stream is None:
         raise HTTPException(
             status_code=404, detail=f"File '{filename}' not found at commit '{commit_hash[:7]}'.")
+    size, chunks = stream
 
     base, ext = os.path.splitext(filename)
     download_filename = f"{base}_rev_{commit_hash[:7]}{ext}"
-    return Response(content, media_type='application/octet-stream', headers={'Content-Disposition': f'attachment; filename="{download_filename}"'})
+    return StreamingResponse(chunks, media_type='application/octet-stream', headers={
+        'Content-Disposition': f'attachment; filename="{download_filename}"',
+        'Content-Length': str(size)
+    })
 
 
 @router.post("/new_upload")
 async def new_upload(
+    ctx: RequestContextDep,
     user: str = Form(...),
     description: str = Form(...),
     rev: str = Form(...),
     is_link_creation: str = Form("false"),
     new_link_filename: Optional[str] = Form(None),
     link_to_master: Optional[str] = Form(None),
-    file: Optional[UploadFile] = File(None),
-    git_repo: GitRepository = Depends(get_git_repo),
-    lock_manager: MetadataManager = Depends(get_lock_manager),
-    current_user: dict = Depends(get_current_user)
+    file: Optional[UploadFile] = File(None)
 ):
     """
     Handle both file uploads and link creation through a single endpoint.
@@ -429,10 +475,10 @@ async def new_upload(
     from datetime import datetime, timezone
     from fastapi.responses import JSONResponse
 
-    if user != current_user.get('sub'):
+    if user != ctx.user.get('sub'):
         raise HTTPException(status_code=403, detail="User mismatch")
 
-    if not git_repo or not lock_manager:
+    if not ctx.git or not ctx.locks:
         raise HTTPException(status_code=500, detail="Repository not available")
 
     # Convert string to boolean
@@ -454,14 +500,15 @@ async def new_upload(
             raise HTTPException(status_code=400, detail=error_message)
 
         # Check if file or link already exists
-        if git_repo.find_file_path(new_link_filename) or git_repo.find_file_path(f"{new_link_filename}.link"):
+        if (await run_in_threadpool(ctx.git.find_file_path, new_link_filename)
+                or await run_in_threadpool(ctx.git.find_file_path, f"{new_link_filename}.link")):
             raise HTTPException(
                 status_code=409,
                 detail=f"File or link '{new_link_filename}' already exists."
             )
 
         # Verify the master file exists
-        master_file_path = git_repo.find_file_path(link_to_master)
+        master_file_path = await run_in_threadpool(ctx.git.find_file_path, link_to_master)
         if not master_file_path:
             raise HTTPException(
                 status_code=404,
@@ -472,7 +519,7 @@ async def new_upload(
             # Create the .link file
             link_data = {"master_file": link_to_master}
             link_filepath_str = f"{new_link_filename}.link"
-            link_full_path = git_repo.repo_path / link_filepath_str
+            link_full_path = ctx.git.repo_path / link_filepath_str
             link_full_path.write_text(json.dumps(link_data, indent=2))
 
             # Create the metadata file for the link
@@ -483,14 +530,14 @@ async def new_upload(
                 "created_by": user,
                 "created_at": datetime.now(timezone.utc).isoformat()
             }
-            meta_full_path = git_repo.repo_path / meta_filename_str
+            meta_full_path = ctx.git.repo_path / meta_filename_str
             meta_full_path.write_text(json.dumps(meta_content, indent=2))
 
             # Commit both files
             commit_message = f"LINK: Create '{new_link_filename}' -> '{link_to_master}' by {user}"
             files_to_commit = [link_filepath_str, meta_filename_str]
-            success = git_repo.commit_and_push(
-                files_to_commit, commit_message, user
+            success = await run_in_threadpool(
+                ctx.git.commit_and_push, files_to_commit, commit_message, user
             )
 
             if success:
@@ -506,8 +553,8 @@ async def new_upload(
         except Exception as e:
             logger.error(f"Error creating link: {e}", exc_info=True)
             # Clean up on error
-            (git_repo.repo_path / link_filepath_str).unlink(missing_ok=True)
-            (git_repo.repo_path / meta_filename_str).unlink(missing_ok=True)
+            (ctx.git.repo_path / link_filepath_str).unlink(missing_ok=True)
+            (ctx.git.repo_path / meta_filename_str).unlink(missing_ok=True)
             raise HTTPException(
                 status_code=500, detail=f"Failed to create link: {str(e)}"
             )
@@ -527,7 +574,7 @@ async def new_upload(
             raise HTTPException(status_code=400, detail=error_message)
 
         # Check if file already exists
-        if git_repo.find_file_path(file.filename):
+        if await run_in_threadpool(ctx.git.find_file_path, file.filename):
             raise HTTPException(
                 status_code=409, detail=f"File '{file.filename}' already exists."
             )
@@ -543,8 +590,8 @@ async def new_upload(
 
         try:
             # Save the file content
-            content = await file.read()
-            git_repo.save_file(file.filename, content)
+            await run_in_threadpool(
+                ctx.git.save_file_from_stream, file.filename, file.file)
 
             # Create metadata file
             meta_filename = f"{file.filename}.meta.json"
@@ -554,14 +601,14 @@ async def new_upload(
                 "created_by": user,
                 "created_at": datetime.now(timezone.utc).isoformat()
             }
-            meta_full_path = git_repo.repo_path / meta_filename
+            meta_full_path = ctx.git.repo_path / meta_filename
             meta_full_path.write_text(json.dumps(meta_content, indent=2))
 
             # Commit both files
             commit_message = f"NEW FILE: Upload '{file.filename}' (Rev {rev}) by {user}"
             files_to_commit = [file.filename, meta_filename]
-            success = git_repo.commit_and_push(
-                files_to_commit, commit_message, user
+            success = await run_in_threadpool(
+                ctx.git.commit_and_push, files_to_commit, commit_message, user
             )
 
             if success:
@@ -579,8 +626,8 @@ async def new_upload(
         except Exception as e:
             logger.error(f"Error uploading file: {e}", exc_info=True)
             # Clean up on error
-            (git_repo.repo_path / file.filename).unlink(missing_ok=True)
-            (git_repo.repo_path / meta_filename).unlink(missing_ok=True)
+            (ctx.git.repo_path / file.filename).unlink(missing_ok=True)
+            (ctx.git.repo_path / meta_filename).unlink(missing_ok=True)
             raise HTTPException(
                 status_code=500, detail=f"Failed to upload file: {str(e)}"
             )
@@ -15,7 +15,7 @@ Architecture:
 """
 
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
-from typing import Dict, List
+from typing import Dict, List, Optional
 from app.core.security import UserAuth
 import logging
 import json
@@ -242,6 +242,7 @@ async def websocket_endpoint(
         - file_locked: Someone checked out a file
         - file_unlocked: Someone checked in a file
         - file_deleted: Admin deleted a file
+        - config_updated: PDM admin configuration changed
         - user_connected: Someone connected
         - user_disconnected: Someone disconnected
         - pong: Response to ping
@@ -332,3 +333,24 @@ async def broadcast_file_update(event_type: str, file_data: dict):
         "data": file_data,
         "timestamp": datetime.utcnow().isoformat()
     })
+
+
+async def broadcast_config_update(updated_by: Optional[str], updated_at: Optional[str]):
+    """
+    Tell all connected users that the PDM admin configuration changed.
+
+    Called after an admin saves the config (admin_config.py) and when the
+    config polling task pulls a newer .pdm-config.json from GitLab. Clients
+    refetch /admin/config/... only when this arrives, instead of polling
+    the config endpoints on a timer.
+
+    Args:
+        updated_by: Username recorded in the config's last_updated_by
+        updated_at: The config's last_updated_at (ISO timestamp) - doubles
+                    as a version token clients can compare
+    """
+    await manager.broadcast({
+        "type": "config_updated",
+        "data": {"updated_by": updated_by, "updated_at": updated_at},
+        "timestamp": datetime.utcnow().isoformat()
+    })
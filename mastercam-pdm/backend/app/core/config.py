@@ -22,8 +22,10 @@ class AppConfig(BaseModel):
         default=[".mcam", ".vnc", ".emcam", ".link"])
     # (The rest of the model stays the same)
     ui: dict = Field(default_factory=dict)
+    # bcrypt_rounds: cost of password hashing (2^rounds iterations). 12 is a
+    # good production value; a dev/test box can drop it to 4 for fast logins.
     security: dict = Field(default_factory=lambda: {
-                           "allow_insecure_ssl": False})
+                           "allow_insecure_ssl": False, "bcrypt_rounds": 12})
     polling: dict = Field(default_factory=lambda: {
                           "enabled": True, "interval_seconds": 15, "check_on_activity": True})
 
@@ -89,6 +91,12 @@ class ConfigManager:
         self.encryption = EncryptionManager(self.config_dir)
         self.config = self._load_config()
 
+        # Serialized GET /config summary. The router fills it in on first use
+        # and save_config() resets it - the config only changes through a save
+        # (startup tweaks happen before the first request), so every other
+        # call is a plain memory read.
+        self.summary_json: bytes | None = None
+
     def _load_config(self) -> AppConfig:
         """Loads configuration from the JSON file."""
         if not self.config_file.exists() or not self.config_file.read_text():
@@ -99,17 +107,42 @@ class ConfigManager:
             # Decrypt the token if it exists
             if token := data.get('gitlab', {}).get('token'):
                 data['gitlab']['token'] = self.encryption.decrypt(token)
-            return AppConfig(**data)
+            config = AppConfig(**data)
+            self._derive_gitlab_fields(config.gitlab)
+            return config
         except (json.JSONDecodeError, TypeError) as e:
             logger.error(
                 f"Failed to load or parse config file, creating a default config: {e}")
             return AppConfig()
 
+    @staticmethod
+    def _derive_gitlab_fields(gitlab: dict):
+        """
+        Fills in values computed from the GitLab settings.
+
+        base_url is usually a full project URL; the login flow needs just the
+        server part for API calls, e.g.
+        "https://gitlab.com/mygroup/myproject" -> "https://gitlab.com".
+        Working that out here, once per load/save, keeps the string juggling
+        off the request path.
+        """
+        base_url = gitlab.get('base_url')
+        if base_url:
+            # Split by /, take first 3 parts (https:, , gitlab.com), rejoin
+            gitlab['base_url_root'] = "/".join(
+                str(base_url).rstrip('/').split('/')[:3])
+        else:
+            gitlab.pop('base_url_root', None)
+
     def save_config(self):
         """Saves the current configuration to the JSON file, encrypting sensitive data."""
         try:
+            self.summary_json = None
+            self._derive_gitlab_fields(self.config.gitlab)
             # model_dump() is the Pydantic v2 replacement for .dict()
             data = self.config.model_dump()
+            # Derived values are rebuilt on load, so they don't go to disk
+            data.get('gitlab', {}).pop('base_url_root', None)
             # Encrypt the token before saving
             if token := data.get('gitlab', {}).get('token'):
                 data['gitlab']['token'] = self.encryption.encrypt(token)
@@ -1,10 +1,13 @@
+import hmac
 import json
+import os
 import secrets
+import threading
 import bcrypt
 import jwt
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Optional, Dict, TYPE_CHECKING
+from typing import Optional, Dict, Tuple, TYPE_CHECKING
 import logging
 
 # This is a special import used for type hinting to avoid circular dependencies.
@@ -16,15 +19,37 @@ logger = logging.getLogger(__name__)
 
 # TODO: In a future step, we will move this to be loaded from a configuration file
 # instead of being hardcoded. For now, it's better to have it here than in main.py.
-ADMIN_USERS = ["admin", "g4m3rm1k3"]
+# A frozenset makes every `username in ADMIN_USERS` check a hash lookup, and
+# nothing can append to it at runtime by accident.
+ADMIN_USERS = frozenset({"admin", "g4m3rm1k3"})
+
+# Tokens are signed with HMAC-SHA256; decode accepts nothing else
+_JWT_ALGORITHM = "HS256"
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+
+# bcrypt cost used when config.security has no "bcrypt_rounds" entry, and
+# the range the bcrypt library accepts
+DEFAULT_BCRYPT_ROUNDS = 12
+_BCRYPT_ROUNDS_RANGE = (4, 31)
 
 
 class UserAuth:
     """Handles all user authentication, password management, and token generation."""
 
-    def __init__(self, git_repo: 'GitRepository', auth_dir: Optional[Path] = None):
+    def __init__(self, git_repo: 'GitRepository', auth_dir: Optional[Path] = None,
+                 bcrypt_rounds: Optional[int] = None):
         self.git_repo = git_repo
 
+        # Cost of new password hashes. Existing hashes keep verifying at
+        # whatever cost they were made with - bcrypt stores it in the hash.
+        if bcrypt_rounds is None:
+            bcrypt_rounds = DEFAULT_BCRYPT_ROUNDS
+            if hasattr(git_repo, 'config_manager'):
+                bcrypt_rounds = git_repo.config_manager.config.security.get(
+                    "bcrypt_rounds", DEFAULT_BCRYPT_ROUNDS)
+        low, high = _BCRYPT_ROUNDS_RANGE
+        self.bcrypt_rounds = min(max(int(bcrypt_rounds), low), high)
+
         # IMPORTANT: Store auth data in app_data, NOT in the repo directory
         # This ensures user passwords persist even if repo is reset/deleted
         if auth_dir is None:
@@ -41,10 +66,35 @@ class UserAuth:
         auth_dir.mkdir(parents=True, exist_ok=True)
         self.auth_file = auth_dir / "users.json"
         self.jwt_secret = self._get_or_create_secret(auth_dir)
+        # PyJWT wants the HMAC key as bytes and would encode the str on every
+        # sign/verify - do it once here
+        self._jwt_key = self.jwt_secret.encode("utf-8")
 
         # This will hold temporary password reset tokens in memory.
         self.reset_tokens: Dict[str, Dict] = {}
 
+        # Guards read-modify-write cycles on users.json. Routes run in a
+        # threadpool, so two admins creating users at the same moment would
+        # otherwise each load, change and save - and one change would be lost.
+        self._users_lock = threading.RLock()
+
+        # Parsed copy of users.json plus the file signature it was read at.
+        # Every login and password check used to re-read and re-parse the
+        # file; now a cheap os.stat tells us whether it changed since.
+        self._users_cache: Optional[dict] = None
+        self._users_stat: Optional[tuple] = None
+        # {lowercased username: username as stored}, rebuilt together with
+        # the cache. GitLab usernames are case-insensitive, so "Bob" should
+        # find "bob" without lowercasing every key on every lookup.
+        self._users_by_lc: Dict[str, str] = {}
+
+        # A throwaway hash with the same cost as real ones. verify_user checks
+        # unknown usernames against it, so a login for a user who doesn't
+        # exist takes as long as one with a wrong password - otherwise the
+        # fast "no such user" answer would reveal which usernames exist.
+        self._dummy_hash = bcrypt.hashpw(
+            secrets.token_bytes(16), bcrypt.gensalt(rounds=self.bcrypt_rounds))
+
     def _get_or_create_secret(self, auth_dir: Path) -> str:
         """
         Retrieves the JWT secret key from a file, or creates one if it doesn't exist.
@@ -59,24 +109,111 @@ class UserAuth:
             secret_file.write_text(secret)
             return secret
 
+    def _users_file_signature(self) -> Optional[tuple]:
+        """(inode, mtime_ns, size) of users.json, or None if it's missing."""
+        try:
+            st = os.stat(self.auth_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _invalidate_users_cache(self):
+        """Forget the cached user database so the next load re-reads it."""
+        self._users_cache = None
+        self._users_stat = None
+        self._users_by_lc = {}
+
+    def _set_users_cache(self, users: dict, signature: Optional[tuple]):
+        """Stores a freshly read or written user database and its index."""
+        self._users_by_lc = {name.lower(): name for name in users}
+        self._users_cache = users
+        self._users_stat = signature
+
     def _load_users(self) -> dict:
-        """Loads the user database from its JSON file."""
-        if not self.auth_file.exists():
+        """
+        Loads the user database from its JSON file.
+
+        The parsed dict is cached and reused for as long as the file's
+        signature stays the same, so a burst of logins costs one stat each
+        instead of an open + read + json.loads. Edits made by hand or by
+        another process change the signature and are picked up on the next
+        call.
+
+        The returned dict is shared - treat it as read-only. Code that wants
+        to change users copies it under _users_lock and hands the copy to
+        _save_users.
+        """
+        signature = self._users_file_signature()
+        if signature is None:
+            self._invalidate_users_cache()
             return {}
+        if self._users_cache is not None and signature == self._users_stat:
+            return self._users_cache
         try:
-            return json.loads(self.auth_file.read_text())
+            users = json.loads(self.auth_file.read_text())
         except (json.JSONDecodeError, FileNotFoundError):
+            self._invalidate_users_cache()
             return {}
+        self._set_users_cache(users, signature)
+        return users
 
     def _save_users(self, users: dict):
-        """Saves the user database to its JSON file."""
-        self.auth_file.write_text(json.dumps(users, indent=2))
+        """
+        Saves the user database to its JSON file.
+
+        Written to a temp file first and then swapped in with os.replace, so
+        a crash mid-write can never leave a half-written users.json behind.
+        The saved dict becomes the new cache entry, so the next load doesn't
+        have to read back what we just wrote.
+        """
+        self._invalidate_users_cache()
+        tmp_file = self.auth_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json.dumps(users, indent=2))
+        os.replace(tmp_file, self.auth_file)
+        self._set_users_cache(users, self._users_file_signature())
+
+    def _stored_username(self, users: dict, username: str) -> Optional[str]:
+        """
+        Maps a username to the key it is stored under in users, ignoring case.
+
+        Every lookup by username goes through here, so "Bob" and "bob" are
+        always the same user. An exact match wins; otherwise the lowercased
+        index is used.
+
+        Returns:
+            The stored username, or None if there is no such user
+        """
+        if username in users:
+            return username
+        stored = self._users_by_lc.get(username.lower())
+        # The index can be a newer generation than `users` if another
+        # thread saved in between - only trust names users actually has
+        return stored if stored in users else None
+
+    def canonical_username(self, username: str) -> Optional[str]:
+        """The username as stored (ignoring case), or None if not found."""
+        return self._stored_username(self._load_users(), username)
+
+    def get_user(self, username: str) -> Optional[dict]:
+        """
+        Looks up a user's record, ignoring the case of the username.
+
+        Returns:
+            The stored record (treat as read-only), or None if not found
+        """
+        users = self._load_users()
+        stored = self._stored_username(users, username)
+        return users[stored] if stored is not None else None
+
+    def has_user(self, username: str) -> bool:
+        """True if the user exists (has set a password), ignoring case."""
+        return self.get_user(username) is not None
 
     def _hash_password(self, password: str) -> str:
         """Hashes a password using bcrypt."""
         # bcrypt has a 72-byte limit, so we truncate the password bytes if necessary.
         password_bytes = password.encode('utf-8')[:72]
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self.bcrypt_rounds)
         hashed_pw = bcrypt.hashpw(password_bytes, salt)
         return hashed_pw.decode('utf-8')
 
@@ -89,42 +226,98 @@ class UserAuth:
             # This can happen if the stored hash is invalid.
             return False
 
+    def upsert_user(self, username: str, password: str, *,
+                    must_exist: bool = False,
+                    must_not_exist: bool = False) -> Tuple[bool, Optional[str]]:
+        """
+        Creates or updates a user's password with one read and one write.
+
+        The existence check and the write happen under the same lock, so
+        nobody can create or delete the user in between. The check ignores
+        case, and an existing user is updated under the name it was stored
+        with rather than gaining a second, differently-cased record.
+
+        Args:
+            username: User to create or update
+            password: New plain-text password
+            must_exist: Fail if the user doesn't exist yet (password reset)
+            must_not_exist: Fail if the user already exists (new account)
+
+        Returns:
+            (True, None) on success, or (False, reason) where reason is
+            "not_found" or "exists"
+        """
+        # Hash before taking the lock - bcrypt is slow on purpose
+        password_hash = self._hash_password(password)
+
+        with self._users_lock:
+            users = dict(self._load_users())
+            stored = self._stored_username(users, username)
+            if must_exist and stored is None:
+                return False, "not_found"
+            if must_not_exist and stored is not None:
+                return False, "exists"
+            if stored is not None:
+                username = stored
+            users[username] = {
+                "gitlab_username": username,
+                "password_hash": password_hash,
+                "is_admin": username in ADMIN_USERS,
+                "created_at": datetime.now(timezone.utc).isoformat()
+            }
+            self._save_users(users)
+        return True, None
+
     def create_user_password(self, username: str, password: str) -> bool:
         """Creates or updates a user's password in the database."""
-        users = self._load_users()
-        users[username] = {
-            "gitlab_username": username,
-            "password_hash": self._hash_password(password),
-            "is_admin": username in ADMIN_USERS,
-            "created_at": datetime.now(timezone.utc).isoformat()
-        }
-        self._save_users(users)
-        return True
+        success, _ = self.upsert_user(username, password)
+        return success
 
     def verify_user(self, username: str, password: str) -> bool:
-        """Checks if a username exists and the provided password is correct."""
-        users = self._load_users()
-        user_data = users.get(username)
+        """
+        Checks if a username exists and the provided password is correct.
+
+        Unknown users still pay for one bcrypt check (against _dummy_hash),
+        so the response time doesn't tell an attacker whether the username
+        is real.
+        """
+        user_data = self.get_user(username)
         if not user_data:
+            bcrypt.checkpw(password.encode('utf-8')[:72], self._dummy_hash)
             return False
         return self._verify_password(password, user_data["password_hash"])
 
-    def create_access_token(self, username: str) -> str:
-        """Generates a JSON Web Token (JWT) for a user."""
-        users = self._load_users()
+    def issue_access_token(self, username: str) -> Tuple[str, bool]:
+        """
+        Generates a JSON Web Token (JWT) for a user.
+
+        This is the one place that decides whether a user is an admin: the
+        answer goes into the token's is_admin claim and is also returned,
+        so login responses and later requests (which read the claim) can
+        never disagree.
+
+        Returns:
+            (token, is_admin)
+        """
+        is_admin = username in ADMIN_USERS
         payload = {
             # 'sub' (subject) is the standard claim for the user ID.
             "sub": username,
-            "is_admin": users.get(username, {}).get("is_admin", False),
+            "is_admin": is_admin,
             # Expiration time
             "exp": datetime.now(timezone.utc) + timedelta(hours=8)
         }
-        return jwt.encode(payload, self.jwt_secret, algorithm="HS256")
+        return jwt.encode(payload, self._jwt_key, algorithm=_JWT_ALGORITHM), is_admin
+
+    def create_access_token(self, username: str) -> str:
+        """Generates a JSON Web Token (JWT) for a user."""
+        token, _ = self.issue_access_token(username)
+        return token
 
     def verify_token(self, token: str) -> Optional[dict]:
         """Decodes and validates a JWT, returning its payload if valid."""
         try:
-            payload = jwt.decode(token, self.jwt_secret, algorithms=["HS256"])
+            payload = jwt.decode(token, self._jwt_key, algorithms=_JWT_ALGORITHMS)
             return payload
         except jwt.ExpiredSignatureError:
             logger.warning("Token has expired.")
@@ -146,9 +339,10 @@ class UserAuth:
         Raises:
             ValueError: If user doesn't exist
         """
-        users = self._load_users()
-        if username not in users:
+        stored = self.canonical_username(username)
+        if stored is None:
             raise ValueError(f"User {username} not found")
+        username = stored
 
         # Generate a secure random token
         reset_token = secrets.token_urlsafe(32)
@@ -159,7 +353,7 @@ class UserAuth:
             "expires": datetime.now(timezone.utc) + timedelta(hours=1)
         }
 
-        logger.info(f"Password reset token generated for user: {username}")
+        logger.info("Password reset token generated for user: %s", username)
         return reset_token
 
     def reset_password(self, username: str, reset_token: str, new_password: str) -> bool:
@@ -174,20 +368,26 @@ class UserAuth:
         Returns:
             True if successful, False if token invalid/expired
         """
+        # Tokens are kept under the stored username - see reset_password_request
+        username = self.canonical_username(username) or username
+
         # Check if user has a reset token
         if username not in self.reset_tokens:
-            logger.warning(f"No reset token found for user: {username}")
+            logger.warning("No reset token found for user: %s", username)
             return False
 
         token_data = self.reset_tokens[username]
 
-        # Verify token matches and hasn't expired
-        if token_data["token"] != reset_token:
-            logger.warning(f"Invalid reset token for user: {username}")
+        # Verify token matches and hasn't expired. compare_digest takes the
+        # same time no matter where the strings differ, so response timing
+        # can't be used to guess the token one character at a time.
+        if not hmac.compare_digest(token_data["token"].encode("utf-8"),
+                                   reset_token.encode("utf-8")):
+            logger.warning("Invalid reset token for user: %s", username)
             return False
 
         if datetime.now(timezone.utc) > token_data["expires"]:
-            logger.warning(f"Expired reset token for user: {username}")
+            logger.warning("Expired reset token for user: %s", username)
             del self.reset_tokens[username]
             return False
 
@@ -197,7 +397,7 @@ class UserAuth:
         # Clean up the used token
         del self.reset_tokens[username]
 
-        logger.info(f"Password successfully reset for user: {username}")
+        logger.info("Password successfully reset for user: %s", username)
         return True
 
     def list_users(self) -> Dict[str, dict]:
@@ -228,10 +428,12 @@ class UserAuth:
         Returns:
             True if deleted, False if user didn't exist
         """
-        users = self._load_users()
-        if username in users:
-            del users[username]
+        with self._users_lock:
+            users = dict(self._load_users())
+            stored = self._stored_username(users, username)
+            if stored is None:
+                return False
+            del users[stored]
             self._save_users(users)
-            logger.info(f"User deleted: {username}")
-            return True
-        return False
+        logger.info("User deleted: %s", username)
+        return True
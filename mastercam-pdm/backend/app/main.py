@@ -18,6 +18,7 @@ from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
+from fastapi.openapi.utils import get_openapi
 from contextlib import asynccontextmanager
 import logging
 from pathlib import Path
@@ -28,6 +29,7 @@ from app.services.lock_service import MetadataManager, ImprovedFileLockManager
 from app.services.git_service import GitRepository, setup_git_lfs_path
 from app.services.admin_config_service import AdminConfigService
 from app.core.security import UserAuth
+from app.api.dependencies import wire_services
 from app.api.routers import auth, files, admin, config, websocket, dashboard, admin_config, gitlab_users
 
 # Configure logging for this module
@@ -74,7 +76,7 @@ async def lifespan(app: FastAPI):
     1. Configure Git LFS
     2. Load configuration from disk
     3. If GitLab is configured, initialize all services
-    4. Store services in app.state for access by routes
+    4. Store services in app.state and wire them into the dependency providers
 
     Shutdown sequence:
     1. Save any config changes to disk
@@ -160,8 +162,14 @@ async def lifespan(app: FastAPI):
             # Load or create default config
             admin_config_service.load_config()
 
-            # Start polling for config updates from GitLab
-            await admin_config_service.start_polling(git_service=git_repo)
+            # Start polling for config updates from GitLab. When a pulled
+            # change is loaded, connected clients get a config_updated event.
+            async def _announce_config(config):
+                await websocket.broadcast_config_update(config.last_updated_by, config.last_updated_at)
+
+            await admin_config_service.start_polling(
+                git_service=git_repo, on_change=_announce_config
+            )
 
             # Store all initialized services on app.state
             # Route handlers will access these via dependency injection
@@ -191,6 +199,10 @@ async def lifespan(app: FastAPI):
         app.state.user_auth = None
         app.state.admin_config_service = None
 
+    # Hand the services to the dependency providers once, so requests don't
+    # have to walk app.state on every call
+    wire_services(app)
+
     yield  # === APPLICATION RUNS HERE ===
 
     # Everything after this point is SHUTDOWN logic
@@ -256,6 +268,39 @@ app.include_router(gitlab_users.router) # /api/gitlab/users/* - GitLab user mana
 app.include_router(websocket.router)    # /ws - Real-time updates
 app.include_router(dashboard.router)    # /api/dashboard/* - Statistics
 
+# === OPENAPI SECURITY SCHEME ===
+
+
+def custom_openapi():
+    """
+    Build the OpenAPI schema with the Bearer auth scheme attached.
+
+    get_current_user reads the Authorization header itself instead of going
+    through an HTTPBearer dependency, so FastAPI no longer discovers the
+    scheme on its own. We add it here so the /docs "Authorize" button still
+    works - this only runs when the schema is generated, never per request.
+    """
+    if app.openapi_schema:
+        return app.openapi_schema
+
+    schema = get_openapi(
+        title=app.title,
+        version=app.version,
+        routes=app.routes,
+    )
+    components = schema.setdefault("components", {})
+    components.setdefault("securitySchemes", {})["Bearer"] = {
+        "type": "http",
+        "scheme": "bearer",
+    }
+    schema["security"] = [{"Bearer": []}]
+
+    app.openapi_schema = schema
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
+
 # === ROOT ENDPOINT ===
 
 
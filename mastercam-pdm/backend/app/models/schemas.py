@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime
 
 # Note: We are only moving the Pydantic models here.
@@ -61,6 +61,13 @@ class AdminOverrideRequest(BaseModel):
                             description="Admin username performing the override")
 
 
+class AdminOverrideBatchRequest(BaseModel):
+    filenames: List[str] = Field(...,
+                                 description="Files whose locks should be removed")
+    admin_user: str = Field(...,
+                            description="Admin username performing the override")
+
+
 class AdminDeleteRequest(BaseModel):
     admin_user: str = Field(...,
                             description="Admin username performing the deletion")
@@ -111,6 +118,8 @@ class ActivityItem(BaseModel):
 class ActivityFeed(BaseModel):
     activities: List[ActivityItem] = Field(...,
                                            description="List of recent activities")
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as ?after= to fetch the next page; null on the last page")
 
 
 class StandardResponse(BaseModel):
@@ -210,6 +219,14 @@ class UserRepositoryAccess(BaseModel):
     repository_ids: List[str] = Field(..., description="List of repository IDs the user can access")
     default_repository_id: Optional[str] = Field(None, description="User's default repository on login")
 
+    @field_validator("repository_ids")
+    @classmethod
+    def _dedupe_repository_ids(cls, value: List[str]) -> List[str]:
+        # Stays a list (keeps the JSON file's order stable), but without
+        # duplicates: each ID then occurs at most once, so removing a
+        # repository is a single list.remove() per user
+        return list(dict.fromkeys(value))
+
 
 class RevisionHistorySettings(BaseModel):
     """Settings for revision-based history display"""
@@ -252,6 +269,22 @@ class AdminConfigUpdateRequest(BaseModel):
     admin_user: str = Field(..., description="Admin username performing the update")
 
 
+class AdminConfigOperation(BaseModel):
+    """One edit inside a bulk admin configuration update"""
+    op: Literal["add", "delete"] = Field(..., description="'add' (add or update) or 'delete'")
+    target: Literal["pattern", "repository", "user_access"] = Field(..., description="What the operation edits")
+    payload: Dict[str, Any] = Field(
+        ...,
+        description="For 'add': the FileNamePattern / RepositoryConfig / UserRepositoryAccess. "
+                    "For 'delete': {'name': ...}, {'id': ...} or {'username': ...}"
+    )
+
+
+class AdminConfigBulkRequest(BaseModel):
+    """Apply several configuration edits with a single save"""
+    operations: List[AdminConfigOperation] = Field(..., min_length=1, description="Edits, applied in order")
+
+
 class RevisionRangeFilter(BaseModel):
     """Filter for revision-based history queries"""
     start_revision: Optional[str] = Field(None, description="Starting revision (e.g., '1.0')")
@@ -8,13 +8,18 @@ This service handles:
 - Validating configuration changes
 """
 
-import json
+import re
+import time
 import asyncio
 import logging
+from contextlib import asynccontextmanager
+from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, List, Set, Tuple
 from datetime import datetime, timezone
-from git import Repo, GitCommandError
+from git import Repo
+from pydantic import ValidationError
 
 from app.models.schemas import (
     PDMAdminConfig,
@@ -27,11 +32,86 @@ from app.models.schemas import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ConfigIndex:
+    """
+    Dict lookups over one PDMAdminConfig's lists.
+
+    The config stores patterns, repositories and user access as lists
+    (that's what the JSON file holds), so "find X by name" is a linear
+    scan. ConfigIndex builds dicts once so every later lookup is O(1).
+
+    Forward indexes (entry by key):
+        patterns:      pattern name -> FileNamePattern
+        repositories:  repo id      -> RepositoryConfig
+        user_access:   username     -> UserRepositoryAccess
+
+    Reverse indexes ("who depends on this?" - what the delete checks ask):
+        pattern_repos:  pattern name -> ids of repos using that pattern
+        default_users:  repo id      -> usernames whose default repo it is
+        access_users:   repo id      -> usernames with access to it
+
+    An index describes the config it was built from at that moment. Code
+    that edits the config should keep the index in step through the
+    add_*/remove_* methods (see the edit helpers in the admin_config
+    router) or build a new one.
+    """
+    patterns: Dict[str, FileNamePattern] = field(default_factory=dict)
+    repositories: Dict[str, RepositoryConfig] = field(default_factory=dict)
+    user_access: Dict[str, UserRepositoryAccess] = field(default_factory=dict)
+    pattern_repos: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
+    default_users: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
+    access_users: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
+
+    @classmethod
+    def build(cls, config: PDMAdminConfig) -> "ConfigIndex":
+        """Index `config` by pattern name, repository id and username"""
+        index = cls()
+        for pattern in config.filename_patterns:
+            index.patterns[pattern.name] = pattern
+        for repo in config.repositories:
+            index.add_repository(repo)
+        for access in config.user_access:
+            index.add_user_access(access)
+        return index
+
+    def add_repository(self, repo: RepositoryConfig) -> None:
+        """Record a repository (which must not be indexed yet)"""
+        self.repositories[repo.id] = repo
+        self.pattern_repos[repo.filename_pattern_id].add(repo.id)
+
+    def remove_repository(self, repo: RepositoryConfig) -> None:
+        """Forget a repository and the pattern usage it contributed"""
+        self.repositories.pop(repo.id, None)
+        self.pattern_repos[repo.filename_pattern_id].discard(repo.id)
+
+    def add_user_access(self, access: UserRepositoryAccess) -> None:
+        """Record a user's access entry (which must not be indexed yet)"""
+        self.user_access[access.username] = access
+        for repo_id in access.repository_ids:
+            self.access_users[repo_id].add(access.username)
+        if access.default_repository_id:
+            self.default_users[access.default_repository_id].add(access.username)
+
+    def remove_user_access(self, access: UserRepositoryAccess) -> None:
+        """Forget a user's access entry and its reverse-index entries"""
+        self.user_access.pop(access.username, None)
+        for repo_id in access.repository_ids:
+            self.access_users[repo_id].discard(access.username)
+        if access.default_repository_id:
+            self.default_users[access.default_repository_id].discard(access.username)
+
+
 class AdminConfigService:
     """Manages admin configuration stored in GitLab repository"""
 
     CONFIG_FILE_NAME = ".pdm-config.json"
 
+    # How long get_config() trusts its in-memory copy before re-checking the
+    # config file's mtime. Within the TTL a read is a plain attribute lookup;
+    # after it, one stat() decides whether the file needs re-parsing.
+    CONFIG_CACHE_TTL = 30.0
+
     def __init__(self, repo_path: str, git_repo: Optional[Repo] = None):
         """
         Initialize admin config service
@@ -45,7 +125,28 @@ class AdminConfigService:
         self.config_file_path = self.repo_path / self.CONFIG_FILE_NAME
         self._config: Optional[PDMAdminConfig] = None
         self._last_modified: Optional[float] = None
+        # time.monotonic() of the last load/save/revalidation of self._config
+        self._cache_ts: float = 0.0
+        # Bumped every time self._config is replaced, so callers holding
+        # something derived from the config (e.g. a serialized response)
+        # can tell cheaply whether it is still current
+        self._generation: int = 0
+        # ConfigIndex of self._config, rebuilt lazily when the generation moves
+        self._index: Optional[ConfigIndex] = None
+        self._index_generation: int = -1
+        # pattern name -> (compiled link_pattern, compiled file_pattern),
+        # rebuilt together with the index
+        self._compiled_patterns: Dict[str, Tuple[re.Pattern, re.Pattern]] = {}
+        # username -> repository IDs, as returned by get_user_repositories(),
+        # plus the config it was computed from. On a config change only the
+        # affected users' entries are dropped (see _refresh_user_repo_cache)
+        self._user_repo_cache: Dict[str, List[str]] = {}
+        self._user_repo_source: Optional[PDMAdminConfig] = None
         self._polling_task: Optional[asyncio.Task] = None
+        # Serializes read-modify-write of the config. Without it two admins
+        # editing at once would each clone the same config, and whichever
+        # saved second would silently drop the other's change.
+        self.save_lock = asyncio.Lock()
 
     def get_default_config(self) -> PDMAdminConfig:
         """
@@ -118,33 +219,61 @@ class AdminConfigService:
         try:
             if not self.config_file_path.exists():
                 logger.info("No config file found, creating default configuration")
-                self._config = self.get_default_config()
-                self.save_config(self._config, system_user="system")
-                return self._config
-
-            # Read config file
-            with open(self.config_file_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-
-            # Parse into Pydantic model
-            self._config = PDMAdminConfig(**config_data)
+                config = self.get_default_config()
+                self._config = config
+                self._generation += 1
+                self.save_config(config, system_user="system")
+                return config
+
+            # Read and parse in one step: model_validate_json() decodes the
+            # JSON and validates it inside pydantic-core, without building an
+            # intermediate dict with the json module first
+            raw = self.config_file_path.read_bytes()
+            self._config = PDMAdminConfig.model_validate_json(raw)
+            self._generation += 1
             self._last_modified = self.config_file_path.stat().st_mtime
+            self._cache_ts = time.monotonic()
 
             logger.info(f"Loaded admin configuration (version {self._config.version})")
             return self._config
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in config file: {e}")
-            logger.info("Falling back to default configuration")
-            self._config = self.get_default_config()
-            return self._config
+        except ValidationError as e:
+            # Malformed JSON lands here too (error type "json_invalid")
+            logger.error(f"Invalid config file: {e}")
+            return self._fallback_config()
 
         except Exception as e:
             logger.error(f"Error loading config: {e}")
-            logger.info("Falling back to default configuration")
-            self._config = self.get_default_config()
+            return self._fallback_config()
+
+    def _fallback_config(self) -> PDMAdminConfig:
+        """
+        Pick the configuration to use when the config file can't be loaded.
+
+        If we already hold a configuration that loaded fine, keep serving it
+        (last-known-good) rather than swapping every user over to the
+        defaults because of, say, a half-written file during a pull. Only
+        with nothing loaded yet do we fall back to get_default_config().
+
+        Returns:
+            The last good PDMAdminConfig, or the defaults
+        """
+        if self._config is not None:
+            logger.warning("Keeping last known good configuration")
+            # Don't retry the same broken file on every TTL expiry - the
+            # next change to it will bump the mtime and trigger a reload
+            try:
+                self._last_modified = self.config_file_path.stat().st_mtime
+            except OSError:
+                pass
+            self._cache_ts = time.monotonic()
             return self._config
 
+        logger.info("Falling back to default configuration")
+        self._config = self.get_default_config()
+        self._generation += 1
+        return self._config
+
     def save_config(self, config: PDMAdminConfig, system_user: str) -> bool:
         """
         Save configuration to GitLab repository
@@ -162,28 +291,39 @@ class AdminConfigService:
             config.last_updated_at = datetime.now(timezone.utc).isoformat()
 
             # Write to file
-            with open(self.config_file_path, 'w', encoding='utf-8') as f:
-                json.dump(config.model_dump(), f, indent=2)
+            # model_dump_json() serializes straight from the model. The model
+            # is already validated (a transaction copy or a request body), so
+            # nothing is re-validated on the way out.
+            self.config_file_path.write_text(config.model_dump_json(indent=2), encoding='utf-8')
 
+            # Swap the cache over to the saved instance. From here on it is
+            # shared (see get_config()), so callers must not keep editing it.
             self._config = config
+            self._generation += 1
             self._last_modified = self.config_file_path.stat().st_mtime
+            self._cache_ts = time.monotonic()
 
-            # Commit and push to GitLab if git_repo is available
+            # Commit and push to GitLab if git_repo is available. This goes
+            # through commit_and_push() so it takes the same repository locks
+            # as the file routes instead of racing them on the index.
             if self.git_repo and hasattr(self.git_repo, 'repo'):
-                try:
-                    repo = self.git_repo.repo
-                    repo.index.add([str(self.config_file_path)])
-                    repo.index.commit(
-                        f"PDM Config: Updated by {system_user}\n\n"
-                        f"Configuration updated at {config.last_updated_at}"
-                    )
-                    origin = repo.remote('origin')
-                    origin.push()
-                    logger.info(f"Admin config saved and pushed to GitLab by {system_user}")
-                except GitCommandError as e:
-                    logger.error(f"Git operation failed: {e}")
-                    # Config saved locally, but not pushed
-                    return True
+                config_rel_path = str(
+                    self.config_file_path.relative_to(self.git_repo.repo_path))
+                pushed = self.git_repo.commit_and_push(
+                    [config_rel_path],
+                    f"PDM Config: Updated by {system_user}\n\n"
+                    f"Configuration updated at {config.last_updated_at}",
+                    system_user
+                )
+                if not pushed:
+                    # Keep the cache: dropping it would make every get_config()
+                    # retry the save (and its network fetch) while GitLab is
+                    # down. If commit_and_push()'s reset to origin did rewrite
+                    # the file, its newer mtime makes check_for_updates()
+                    # reload it on the next TTL expiry.
+                    logger.error(f"Failed to push admin config saved by {system_user}")
+                    return False
+                logger.info(f"Admin config saved and pushed to GitLab by {system_user}")
 
             logger.info(f"Admin config saved by {system_user}")
             return True
@@ -196,13 +336,175 @@ class AdminConfigService:
         """
         Get current configuration (load if not cached)
 
+        The cached copy is served as-is for CONFIG_CACHE_TTL seconds. Once it
+        is older than that, check_for_updates() compares the file's mtime and
+        only re-parses the JSON when it actually changed (e.g. after a pull).
+
+        READ-ONLY: this is the shared cached instance, not a copy. Mutating
+        it would silently change what every other request sees (and what
+        the index and response caches were built from). To change the
+        config, edit clone_config() / transaction() and pass that to
+        save_config().
+
         Returns:
             Current PDMAdminConfig instance
         """
         if self._config is None:
             return self.load_config()
+        if time.monotonic() - self._cache_ts >= self.CONFIG_CACHE_TTL:
+            self.check_for_updates()
+            self._cache_ts = time.monotonic()
         return self._config
 
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever the cached configuration is replaced"""
+        return self._generation
+
+    def get_index(self) -> ConfigIndex:
+        """
+        Get the lookup index for the current configuration.
+
+        Built on first use after each config change (generation bump) and
+        reused until the next one.
+
+        Returns:
+            ConfigIndex of get_config()
+        """
+        config = self.get_config()
+        if self._index is None or self._index_generation != self._generation:
+            self._index = ConfigIndex.build(config)
+            self._compiled_patterns = self._compile_patterns(config)
+            self._index_generation = self._generation
+        return self._index
+
+    @staticmethod
+    def _compile_patterns(config: PDMAdminConfig) -> Dict[str, Tuple[re.Pattern, re.Pattern]]:
+        """
+        Compile every filename pattern's link/file regex once.
+
+        Filename validation runs on every upload, check-in and link
+        creation; handing it compiled objects skips re.compile() (and its
+        cache lookup) on each call. A pattern whose regex doesn't compile
+        is left out - callers then fall back to their own error handling.
+        """
+        compiled = {}
+        for pattern in config.filename_patterns:
+            try:
+                compiled[pattern.name] = (
+                    re.compile(pattern.link_pattern),
+                    re.compile(pattern.file_pattern),
+                )
+            except re.error as e:
+                logger.error(f"Invalid regex in pattern '{pattern.name}': {e}")
+        return compiled
+
+    def get_compiled_pattern(self, pattern_id: str) -> Optional[Tuple[re.Pattern, re.Pattern]]:
+        """
+        Get the precompiled regexes for a filename pattern
+
+        Args:
+            pattern_id: Pattern name/identifier
+
+        Returns:
+            (link_regex, file_regex) if the pattern exists and compiles, None otherwise
+        """
+        self.get_index()  # make sure the compiled map matches the current config
+        return self._compiled_patterns.get(pattern_id)
+
+    def clone_config(self) -> PDMAdminConfig:
+        """
+        Get a private, mutable deep copy of the current configuration.
+
+        Copying happens only here, on the write path - reads share the
+        cached instance from get_config() without paying for a copy.
+
+        Returns:
+            Deep copy of get_config()
+        """
+        return self.get_config().model_copy(deep=True)
+
+    @asynccontextmanager
+    async def transaction(self, system_user: str) -> AsyncIterator[PDMAdminConfig]:
+        """
+        Edit a copy of the configuration and save it once at the end.
+
+        Any number of changes made inside the block are validated and written
+        (one file write, one commit, one push) when it exits normally. If the
+        block raises, nothing is saved and the cached config is untouched,
+        because the edits were made on a deep copy.
+
+        Transactions run one at a time (save_lock), so concurrent edits
+        queue up instead of overwriting each other.
+
+        The save runs in a worker thread (asyncio.to_thread): the Git commit
+        and push can take seconds, and doing them on the event loop would
+        stall every other request - GETs included - until they finish.
+
+        Args:
+            system_user: Username recorded as last_updated_by
+
+        Yields:
+            A private, mutable copy of the current PDMAdminConfig
+
+        Raises:
+            ValueError: The edited configuration failed validate_config()
+            RuntimeError: save_config() failed
+
+        Example:
+            async with config_service.transaction("alice") as cfg:
+                cfg.filename_patterns.append(pattern)
+                cfg.repositories.append(repo)
+        """
+        # Clone, edit and save all under save_lock: the clone must be of the
+        # config as the previous writer left it, not a copy taken before
+        # that writer finished
+        async with self.save_lock:
+            config = self.clone_config()
+            yield config
+
+            is_valid, error_msg = self.validate_config(config)
+            if not is_valid:
+                raise ValueError(error_msg)
+            if not await self._save_in_thread(config, system_user):
+                raise RuntimeError("Failed to save configuration")
+
+    async def save(self, config: PDMAdminConfig, system_user: str) -> bool:
+        """
+        Save a complete configuration from async code.
+
+        Waits for any transaction() in progress (save_lock), then runs
+        save_config() in a worker thread.
+
+        Args:
+            config: Validated PDMAdminConfig to save
+            system_user: Username recorded as last_updated_by
+
+        Returns:
+            True if successful, False otherwise
+        """
+        async with self.save_lock:
+            return await self._save_in_thread(config, system_user)
+
+    async def _save_in_thread(self, config: PDMAdminConfig, system_user: str) -> bool:
+        # The one place save_config() is offloaded: the Git commit and push
+        # can take seconds, and the repository lock may be held by a file
+        # check-in, so it must never run on the event loop
+        return await asyncio.to_thread(self.save_config, config, system_user)
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached configuration so the next get_config() re-reads the file.
+
+        Use this after changing .pdm-config.json behind the service's back
+        (a manual edit, a repository reset, ...). save_config() keeps the
+        cache current on its own and doesn't need it.
+        """
+        self._config = None
+        self._generation += 1
+        self._last_modified = None
+        self._cache_ts = 0.0
+
     def check_for_updates(self) -> bool:
         """
         Check if configuration file has been updated
@@ -227,17 +529,31 @@ class AdminConfigService:
             logger.error(f"Error checking for config updates: {e}")
             return False
 
-    async def start_polling(self, git_service=None):
+    async def start_polling(self, git_service=None, on_change=None):
         """
         Start polling for configuration updates from GitLab
 
         Args:
             git_service: GitRepository service to pull updates
+            on_change: Optional async callable, awaited with the new
+                       PDMAdminConfig whenever a pulled change is loaded
+                       (e.g. to push a WebSocket event to clients)
         """
         if self._polling_task and not self._polling_task.done():
             logger.warning("Polling already running")
             return
 
+        def remote_config_changed() -> bool:
+            # Check for remote updates
+            git_service.repo.remote('origin').fetch()
+
+            # Check if config file changed
+            local_hash = git_service.repo.git.hash_object(str(self.config_file_path))
+            remote_hash = git_service.repo.git.execute(
+                ['git', 'rev-parse', f'origin/{git_service.repo.active_branch.name}:.pdm-config.json']
+            )
+            return local_hash != remote_hash
+
         async def poll_loop():
             while True:
                 try:
@@ -249,22 +565,18 @@ class AdminConfigService:
                     # Pull latest changes from GitLab
                     if git_service:
                         try:
-                            # Check for remote updates
-                            git_service.repo.remote('origin').fetch()
-
-                            # Check if config file changed
-                            local_hash = git_service.repo.git.hash_object(str(self.config_file_path))
-                            remote_hash = git_service.repo.git.execute(
-                                ['git', 'rev-parse', f'origin/{git_service.branch}:.pdm-config.json']
-                            )
-
-                            if local_hash != remote_hash:
+                            # The fetch and the pull are blocking Git calls
+                            # (the pull may also wait on the repository lock),
+                            # so run them in a worker thread to keep the event
+                            # loop serving requests
+                            if await asyncio.to_thread(remote_config_changed):
                                 logger.info("Remote config changed, pulling updates...")
-                                git_service.pull_latest_changes()
-                                self.check_for_updates()
+                                await asyncio.to_thread(git_service.pull_latest_changes)
+                                if self.check_for_updates() and on_change:
+                                    await on_change(self._config)
 
                         except Exception as e:
-                            logger.debug(f"Config polling check: {e}")
+                            logger.warning(f"Config polling check failed: {e}")
 
                 except asyncio.CancelledError:
                     logger.info("Config polling cancelled")
@@ -296,11 +608,7 @@ class AdminConfigService:
         Returns:
             RepositoryConfig if found, None otherwise
         """
-        config = self.get_config()
-        for repo in config.repositories:
-            if repo.id == repo_id:
-                return repo
-        return None
+        return self.get_index().repositories.get(repo_id)
 
     def get_user_repositories(self, username: str) -> list[str]:
         """
@@ -309,18 +617,75 @@ class AdminConfigService:
         Args:
             username: Username to check
 
+        Results are memoized per user. Treat the returned list as read-only;
+        it is shared with later callers.
+
         Returns:
             List of repository IDs
         """
-        config = self.get_config()
+        self._refresh_user_repo_cache()
+        cached = self._user_repo_cache.get(username)
+        if cached is not None:
+            return cached
+
+        index = self.get_index()
 
         # Find user access entry
-        for access in config.user_access:
-            if access.username == username:
-                return access.repository_ids
+        access = index.user_access.get(username)
+        if access is not None:
+            repo_ids = access.repository_ids
+        else:
+            # If no specific access defined, return all repositories (backward compatibility)
+            repo_ids = list(index.repositories)
 
-        # If no specific access defined, return all repositories (backward compatibility)
-        return [repo.id for repo in config.repositories]
+        self._user_repo_cache[username] = repo_ids
+        return repo_ids
+
+    def _refresh_user_repo_cache(self) -> None:
+        """
+        Drop the get_user_repositories() entries a config change affected.
+
+        Compares the config the cache was built from with the current one:
+        - a user whose access entry changed (added, edited, removed) loses
+          their entry
+        - if the repository list changed, users WITHOUT an access entry
+          (they get "all repositories") lose theirs too
+        Everyone else keeps their cached list. Deleting a repository prunes
+        it from the access entries that had it, so those users are caught
+        by the first rule.
+        """
+        config = self.get_config()
+        old = self._user_repo_source
+        if old is config:
+            return
+        self._user_repo_source = config
+        if old is None or not self._user_repo_cache:
+            self._user_repo_cache.clear()
+            return
+
+        old_access = {a.username: a for a in old.user_access}
+        new_access = {a.username: a for a in config.user_access}
+        for username in old_access.keys() | new_access.keys():
+            before, after = old_access.get(username), new_access.get(username)
+            if before is None or after is None or before.repository_ids != after.repository_ids:
+                self._user_repo_cache.pop(username, None)
+
+        if [r.id for r in old.repositories] != [r.id for r in config.repositories]:
+            for username in list(self._user_repo_cache):
+                if username not in new_access:
+                    del self._user_repo_cache[username]
+
+    def get_user_access(self, username: str) -> Optional[UserRepositoryAccess]:
+        """
+        Get a user's repository access entry
+
+        Args:
+            username: Username to look up
+
+        Returns:
+            UserRepositoryAccess if one is configured, None otherwise
+        """
+        return self.get_index().user_access.get(username)
 
     def get_filename_pattern(self, pattern_id: str) -> Optional[FileNamePattern]:
         """
@@ -332,11 +697,7 @@ class AdminConfigService:
         Returns:
             FileNamePattern if found, None otherwise
         """
-        config = self.get_config()
-        for pattern in config.filename_patterns:
-            if pattern.name == pattern_id:
-                return pattern
-        return None
+        return self.get_index().patterns.get(pattern_id)
 
     def validate_config(self, config: PDMAdminConfig) -> tuple[bool, Optional[str]]:
         """
@@ -376,7 +737,6 @@ class AdminConfigService:
                         return False, f"User '{access.username}' default repo not in their access list"
 
             # Validate regex patterns compile
-            import re
             for pattern in config.filename_patterns:
                 try:
                     re.compile(pattern.link_pattern)
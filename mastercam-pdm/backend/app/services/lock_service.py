@@ -6,7 +6,8 @@ import socket
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 import psutil
 
@@ -151,6 +152,9 @@ class MetadataManager:
         self.repo_path = repo_path
         self.locks_dir = self.repo_path / '.locks'
         self.locks_dir.mkdir(parents=True, exist_ok=True)
+        # Parsed lock files - see _load_locks(). Holds (directory signature,
+        # read-only {file path: lock info} view, [(lock info, locked-at)]).
+        self._locks_cache: Optional[tuple] = None
 
     def _get_lock_file_path(self, file_path_str: str) -> Path:
         """Creates a sanitized, safe filename for the lock file."""
@@ -182,11 +186,15 @@ class MetadataManager:
             "message": message  # Store the checkout message
         }
         lock_file.write_text(json.dumps(lock_data, indent=2))
+        # A forced re-lock rewrites an existing file, which doesn't touch the
+        # directory's mtime, so drop the cache explicitly
+        self._locks_cache = None
         return lock_file
 
     def release_lock(self, file_path: str):
         """Releases a lock by deleting the lock file."""
         self._get_lock_file_path(file_path).unlink(missing_ok=True)
+        self._locks_cache = None
 
     def get_lock_info(self, file_path: str) -> Optional[Dict]:
         """Reads and returns the contents of a lock file if it exists."""
@@ -199,24 +207,73 @@ class MetadataManager:
         except (json.JSONDecodeError, FileNotFoundError):
             logger.warning(f"Could not read or parse lock file: {lock_file}")
             lock_file.unlink(missing_ok=True)
+            self._locks_cache = None
             return None
 
-    def get_all_locks(self) -> list[dict]:
-        """Scans the .locks directory and returns all active locks."""
-        active_locks = []
-        if not self.locks_dir.exists():
-            return active_locks
+    def _locks_dir_signature(self) -> Optional[tuple]:
+        """(inode, mtime) of the .locks directory, or None if it's missing."""
+        try:
+            st = self.locks_dir.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns)
 
-        now_utc = datetime.now(timezone.utc)
+    def _load_locks(self) -> tuple:
+        """
+        Parses every lock file, reusing the last result while nothing changed.
+
+        The file list asks for all locks on every refresh, but checkouts are
+        rare. Adding or removing a file in .locks - our own create/release,
+        or a git pull/reset bringing in other users' locks - updates the
+        directory's mtime, so the cache is keyed on that. Our own writes also
+        clear it directly.
+
+        Returns:
+            (read-only {file path: lock info}, [(lock info, locked-at datetime)])
+        """
+        signature = self._locks_dir_signature()
+        if signature is None:
+            return MappingProxyType({}), []
+
+        cached = self._locks_cache
+        if cached is not None and cached[0] == signature:
+            return cached[1], cached[2]
+
+        # The signature was taken before the scan, so a change made while
+        # scanning shows up as a mismatch on the next call
+        by_path = {}
+        entries = []
         for lock_file in self.locks_dir.glob('*.lock'):
             try:
                 lock_info = json.loads(lock_file.read_text())
                 locked_at_dt = datetime.fromisoformat(
                     lock_info["timestamp"].replace('Z', '+00:00'))
-                duration = (now_utc - locked_at_dt).total_seconds()
-                lock_info['duration_seconds'] = duration
-                active_locks.append(lock_info)
+                by_path[lock_info["file"]] = lock_info
+                entries.append((lock_info, locked_at_dt))
             except (json.JSONDecodeError, KeyError):
                 logger.warning(
                     f"Corrupted lock file found and skipped: {lock_file.name}")
-        return active_locks
+            except FileNotFoundError:
+                continue  # Released while we were scanning
+
+        view = MappingProxyType(by_path)
+        self._locks_cache = (signature, view, entries)
+        return view, entries
+
+    def get_locks_by_path(self) -> Mapping[str, dict]:
+        """
+        All active locks keyed by the locked file's path.
+
+        The mapping and the lock dicts in it are shared between callers until
+        the locks change - read them, don't modify them.
+        """
+        return self._load_locks()[0]
+
+    def get_all_locks(self) -> list[dict]:
+        """Scans the .locks directory and returns all active locks."""
+        now_utc = datetime.now(timezone.utc)
+        # Copies, since duration_seconds is added per call
+        return [
+            dict(lock_info, duration_seconds=(now_utc - locked_at_dt).total_seconds())
+            for lock_info, locked_at_dt in self._load_locks()[1]
+        ]
@@ -26,6 +26,11 @@ ALLOWED_FILE_TYPES = {
     ".link": {"signatures": None},  # Virtual link files
 }
 
+# Default filename rules, used when no admin configuration is available.
+# Compiled once here instead of on every validation call.
+DEFAULT_LINK_PATTERN = re.compile(r"^\d{7}(_[A-Z]{3}\d{3})?$")
+DEFAULT_FILE_PATTERN = re.compile(r"^\d{7}(_[A-Z]{1,3}\d{1,3})?$")
+
 
 def validate_link_filename_format(
     filename: str,
@@ -37,6 +42,7 @@ def validate_link_filename_format(
     Args:
         filename: The link filename to validate (without .link extension)
         pattern_config: Optional dict with 'link_pattern', 'max_stem_length', and 'description'
+                       (plus an optional precompiled 'link_regex').
                        If None, uses default pattern
 
     Returns:
@@ -54,12 +60,13 @@ def validate_link_filename_format(
 
     # Use pattern from config or default
     if pattern_config:
-        pattern_str = pattern_config.get('link_pattern', r"^\d{7}(_[A-Z]{3}\d{3})?$")
+        pattern = pattern_config.get('link_regex')
+        pattern_str = pattern_config.get('link_pattern', DEFAULT_LINK_PATTERN.pattern)
         max_length = pattern_config.get('max_stem_length', 13)
         description = pattern_config.get('description', 'configured pattern')
     else:
         # Default pattern
-        pattern_str = r"^\d{7}(_[A-Z]{3}\d{3})?$"
+        pattern = DEFAULT_LINK_PATTERN
         max_length = 13
         description = "7 digits, optional underscore + 3 UPPERCASE letters + 3 numbers"
 
@@ -69,7 +76,8 @@ def validate_link_filename_format(
 
     # Validate against pattern
     try:
-        pattern = re.compile(pattern_str)
+        if pattern is None:
+            pattern = re.compile(pattern_str)
         if not pattern.match(filename):
             return False, f"Link name must follow the format: {description} (e.g., 1234567_ABC123)."
     except re.error as e:
@@ -89,6 +97,7 @@ def validate_filename_format(
     Args:
         filename: The filename to validate (with extension)
         pattern_config: Optional dict with 'file_pattern', 'max_stem_length', and 'description'
+                       (plus an optional precompiled 'file_regex').
                        If None, uses default pattern
 
     Returns:
@@ -104,12 +113,13 @@ def validate_filename_format(
 
     # Use pattern from config or default
     if pattern_config:
-        pattern_str = pattern_config.get('file_pattern', r"^\d{7}(_[A-Z]{1,3}\d{1,3})?$")
+        pattern = pattern_config.get('file_regex')
+        pattern_str = pattern_config.get('file_pattern', DEFAULT_FILE_PATTERN.pattern)
         max_length = pattern_config.get('max_stem_length', 15)
         description = pattern_config.get('description', 'configured pattern')
     else:
         # Default pattern
-        pattern_str = r"^\d{7}(_[A-Z]{1,3}\d{1,3})?$"
+        pattern = DEFAULT_FILE_PATTERN
         max_length = 15
         description = "7 digits, optional underscore + 1-3 UPPERCASE letters + 1-3 numbers"
 
@@ -119,7 +129,8 @@ def validate_filename_format(
 
     # Validate against pattern
     try:
-        pattern = re.compile(pattern_str)
+        if pattern is None:
+            pattern = re.compile(pattern_str)
         if not pattern.match(stem):
             return False, f"Filename must follow the format: {description} (e.g., 1234567_AB123)."
     except re.error as e:
@@ -231,10 +242,14 @@ def get_pattern_config_from_service(admin_config_service, repo_id: Optional[str]
         if not pattern:
             return None
 
-        # Return pattern config as dict
+        # Return pattern config as dict, with the service's precompiled
+        # regexes so the validators don't compile them per call
+        compiled = admin_config_service.get_compiled_pattern(pattern.name)
         return {
             'link_pattern': pattern.link_pattern,
             'file_pattern': pattern.file_pattern,
+            'link_regex': compiled[0] if compiled else None,
+            'file_regex': compiled[1] if compiled else None,
             'max_stem_length': pattern.max_stem_length,
             'description': pattern.description
         }